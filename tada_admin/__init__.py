@@ -11,23 +11,35 @@ from . import models
 from . import services
 from . import wizards
 
+import importlib.util
 import logging
 
 _logger = logging.getLogger(__name__)
 
+# Default configuration parameters created at install time (only if missing)
+_DEFAULT_CONFIG_PARAMS = (
+    ('tada_admin.base_url', 'https://chain2-api.chain2gate.it'),
+    ('tada_admin.configured', 'false'),
+)
+
+# Configuration parameters removed at uninstall time
+_UNINSTALL_PARAM_KEYS = (
+    'tada_admin.api_key',
+    'tada_admin.base_url',
+    'tada_admin.configured',
+)
+
 
 def pre_init_hook(cr):
     """Pre-initialization hook for TADA Admin module."""
     _logger.info("TADA Admin module pre-initialization started")
     
-    # Check if required Python packages are available
-    try:
-        import requests
-        _logger.info("All required Python packages are available")
-    except ImportError as e:
-        _logger.error(f"Missing required Python package: {e}")
+    # Check if required Python packages are available without importing them
+    if importlib.util.find_spec('requests') is None:
+        _logger.error("Missing required Python package: requests")
         _logger.error("Please install required packages: pip install requests")
-        raise
+        raise ImportError("No module named 'requests'")
+    _logger.info("All required Python packages are available")
 
 
 def post_init_hook(cr, registry=None):
@@ -48,19 +60,13 @@ def post_init_hook(cr, registry=None):
     config_params = env['ir.config_parameter'].sudo()
     
     # Set default values for configuration parameters - only if they don't exist
-    defaults = {
-        'tada_admin.base_url': 'https://chain2-api.chain2gate.it',
-        'tada_admin.configured': 'false',
-    }
-    
-    for param, default_value in defaults.items():
-        existing_param = config_params.search([('key', '=', param)], limit=1)
-        if not existing_param:
-            # Only create if it doesn't exist at all
-            config_params.create({'key': param, 'value': default_value})
-            _logger.info(f"Created default configuration parameter: {param} = {default_value}")
+    # get_param is ormcached on the key, set_param handles the create itself
+    for param, default_value in _DEFAULT_CONFIG_PARAMS:
+        if config_params.get_param(param) is False:
+            config_params.set_param(param, default_value)
+            _logger.info("Created default configuration parameter: %s = %s", param, default_value)
         else:
-            _logger.info(f"Configuration parameter already exists: {param}")
+            _logger.info("Configuration parameter already exists: %s", param)
     
     _logger.info("TADA Admin module initialization completed successfully")
 
@@ -76,15 +82,10 @@ def uninstall_hook(cr, registry):
     config_params = env['ir.config_parameter'].sudo()
     
     # Remove TADA Admin configuration parameters
-    params_to_remove = [
-        'tada_admin.api_key',
-        'tada_admin.base_url', 
-        'tada_admin.configured',
-    ]
-    
-    for param in params_to_remove:
-        config_params.search([('key', '=', param)]).unlink()
-        _logger.info(f"Removed configuration parameter: {param}")
+    params = config_params.search([('key', 'in', list(_UNINSTALL_PARAM_KEYS))])
+    removed_keys = params.mapped('key')
+    params.unlink()
+    _logger.info("Removed %d configuration parameters: %s", len(removed_keys), ', '.join(removed_keys))
     
     _logger.info("TADA Admin module uninstall completed")
 
@@ -94,4 +95,4 @@ __version__ = '1.0.0'
 __author__ = 'TADA Admin Team'
 __email__ = 'support@tada-admin.com'
 
-_logger.info(f"TADA Admin Odoo Integration Module v{__version__} loaded")
\ No newline at end of file
+_logger.info("TADA Admin Odoo Integration Module v%s loaded", __version__)
\ No newline at end of file
@@ -14,6 +14,10 @@ class AuthorizationError(Exception):
     - Authorization validation fails
     """
     
+    # BaseException instances keep their own __dict__, so slots don't remove
+    # it; they do give the declared attributes fixed storage and faster access.
+    __slots__ = ('company_id', 'permission_type', 'message')
+    
     def __init__(self, company_id, permission_type, message=None):
         """
         Initialize AuthorizationError
@@ -46,17 +50,23 @@ class DataAccessError(Exception):
     - Data filtering reveals unauthorized access attempts
     """
     
+    __slots__ = ('company_id', 'pod_ids', 'message')
+    
     def __init__(self, company_id, pod_ids, message=None):
         """
         Initialize DataAccessError
         
         Args:
             company_id (int): ID of the company attempting unauthorized access
-            pod_ids (list): List of POD IDs that were accessed without authorization
+            pod_ids (list|tuple|str): POD ID(s) that were accessed without authorization,
+                stored as a tuple
             message (str, optional): Custom error message
         """
         self.company_id = company_id
-        self.pod_ids = pod_ids if isinstance(pod_ids, list) else [pod_ids]
+        if isinstance(pod_ids, (list, tuple, set, frozenset)):
+            self.pod_ids = tuple(pod_ids)
+        else:
+            self.pod_ids = (pod_ids,)
         
         if message is None:
             pod_list = ', '.join(str(pod) for pod in self.pod_ids)
@@ -79,6 +89,8 @@ class Chain2GateError(Exception):
     - Data synchronization failures
     """
     
+    __slots__ = ('operation', 'status_code', 'response_data', 'message')
+    
     def __init__(self, operation, status_code=None, response_data=None, message=None):
         """
         Initialize Chain2GateError
@@ -1,3 +1,4 @@
 # -*- coding: utf-8 -*-
 
-from . import dataclass_mixin
\ No newline at end of file
+from . import dataclass_mixin
+from . import pod_request_mixin
\ No newline at end of file
@@ -4,21 +4,146 @@ Abstract mixin that provides dataclass integration for TADA ERP SDK models in Od
 """
 
 from odoo import models, fields, api
+from odoo.osv import expression
 from odoo.exceptions import ValidationError, UserError, AccessError
 from typing import Type, Dict, Any, Optional, List, Union
 import logging
+import re
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from dataclasses import asdict, fields as dataclass_fields
-from enum import Enum
+from functools import lru_cache
+from dataclasses import fields as dataclass_fields
+from enum import Enum, EnumMeta
 
 from ..sdk.chain2gate_sdk import Chain2GateSDK
 from ...utils.api_error_handler import (
     APIErrorHandler, validate_api_configuration, log_api_call, with_api_error_handling
 )
+from ...utils.fiscal_code_validator import validate_fiscal_code_cached
 from ...utils.multi_company_validator import MultiCompanyValidator, ensure_company_isolation
 
 _logger = logging.getLogger(__name__)
 
+# Common datetime formats returned by the API
+_DATETIME_FORMATS = (
+    '%Y-%m-%dT%H:%M:%S.%fZ',  # ISO format with microseconds and Z
+    '%Y-%m-%dT%H:%M:%SZ',     # ISO format without microseconds
+    '%Y-%m-%dT%H:%M:%S.%f',   # ISO format with microseconds, no Z
+    '%Y-%m-%dT%H:%M:%S',      # ISO format without microseconds, no Z
+    '%Y-%m-%d %H:%M:%S',      # Standard format
+    '%Y-%m-%d',               # Date only
+)
+
+# Sentinel for attributes missing on a record
+_MISSING = object()
+
+# Index of the last format that matched. API batches use one format
+# consistently, so it is tried first; racy updates are harmless.
+_last_datetime_format = [0]
+
+
+# SDK clients per (database, company id, api key, base url), so their HTTP
+# session and its keep-alive connections are reused across API calls. Each
+# worker thread keeps its own bounded cache: a requests Session must not be
+# shared between threads.
+_SDK_CACHE_SIZE = 16
+_sdk_local = threading.local()
+
+
+def _get_sdk_cache():
+    """Return the current thread's SDK client cache, oldest entries first."""
+    cache = getattr(_sdk_local, 'instances', None)
+    if cache is None:
+        cache = _sdk_local.instances = OrderedDict()
+    return cache
+
+
+def clear_sdk_cache(dbname=None, company_ids=None):
+    """
+    Drop the current thread's cached SDK clients.
+    
+    Clients cached by other threads are keyed on the old API key and base
+    URL, so they are never used for the new settings and age out of their
+    bounded caches.
+    
+    Args:
+        dbname (str, optional): Only drop clients of this database
+        company_ids (iterable, optional): Only drop clients of these companies
+    """
+    cache = _get_sdk_cache()
+    if dbname is None and company_ids is None:
+        cache.clear()
+        return
+    company_ids = set(company_ids) if company_ids is not None else None
+    for key in [
+        key for key in cache
+        if (dbname is None or key[0] == dbname)
+        and (company_ids is None or key[1] in company_ids)
+    ]:
+        cache.pop(key, None)
+
+
+# Single pattern covering the ISO layouts above, parsed without strptime
+_DATETIME_RE = re.compile(
+    r'^(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?Z?)?$'
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_dt_cached(value):
+    """Parse a datetime string with the known formats, memoized per value."""
+    match = _DATETIME_RE.match(value)
+    if match:
+        year, month, day, hour, minute, second, fraction = match.groups()
+        try:
+            return datetime(
+                int(year), int(month), int(day),
+                int(hour or 0), int(minute or 0), int(second or 0),
+                int(fraction.ljust(6, '0')) if fraction else 0,
+            )
+        except ValueError:
+            # Out-of-range components; let the format loop have the final say
+            pass
+    
+    count = len(_DATETIME_FORMATS)
+    start = _last_datetime_format[0]
+    for offset in range(count):
+        index = (start + offset) % count
+        try:
+            parsed = datetime.strptime(value, _DATETIME_FORMATS[index])
+        except ValueError:
+            continue
+        _last_datetime_format[0] = index
+        return parsed
+    return None
+
+
+def _has_company_filter(domain):
+    """Return whether a search domain already filters on company_id."""
+    for clause in domain or ():
+        # Leaves are sequences; operators ('&', '|', '!') compare '&' != 'company_id'
+        try:
+            if clause[0] == 'company_id':
+                return True
+        except (TypeError, IndexError):
+            pass
+    return False
+
+
+def _match_key(key_maps, keys):
+    """Return the value of the first complete key found in its map, or None."""
+    for key_map, key in zip(key_maps, keys):
+        if all(key) and key in key_map:
+            return key_map[key]
+    return None
+
+
+@lru_cache(maxsize=None)
+def _company_leaf(company_id):
+    """Return the shared company_id domain leaf for a company."""
+    return ('company_id', '=', company_id)
+
 
 class TadaDataclassModelMixin(models.AbstractModel):
     """
@@ -44,90 +169,162 @@ class TadaDataclassModelMixin(models.AbstractModel):
     # SDK integration
     _dataclass_type: Type = None  # Override in concrete models
     _sdk_field_mapping: Dict[str, str] = {}  # Odoo field -> SDK field mapping
+    _sync_chunk_size = 100  # Records applied per savepoint during API sync
+    _updated_at_trigger = False  # True when a BEFORE UPDATE trigger maintains updated_at
+    
+    @classmethod
+    def _get_to_vals(cls):
+        """
+        Return the generated converter for ``_dataclass_type``, or None.
+        
+        Built on first use and cached in the model class's own ``__dict__``,
+        since Odoo creates registry classes without ``__init_subclass__``.
+        """
+        to_vals = cls.__dict__.get('_to_vals_fn', _MISSING)
+        if to_vals is _MISSING:
+            to_vals = cls._build_to_vals() if cls._dataclass_type else None
+            cls._to_vals_fn = to_vals
+        return to_vals
     
-    def _is_enum_field(self, field_type) -> bool:
+    @classmethod
+    def _build_to_vals(cls):
+        """
+        Generate a ``_to_vals(self, instance)`` converter specialized for
+        ``_dataclass_type``, the way ``dataclasses`` generates ``__init__``.
+        
+        Field mapping, list skipping and the enum/datetime classification are
+        resolved here once, leaving one straight-line assignment per field.
+        """
+        lines = ['def _to_vals(self, inst):', '    v = {}']
+        for dc_field in dataclass_fields(cls._dataclass_type):
+            field_type = dc_field.type
+            if getattr(field_type, '__origin__', None) is Union:
+                # Optional[X] converts like X
+                args = [arg for arg in field_type.__args__ if arg is not type(None)]
+                if len(args) == 1:
+                    field_type = args[0]
+            # List/relationship fields are handled by specific models
+            if getattr(field_type, '__origin__', None) is list:
+                continue
+            
+            name = dc_field.name
+            odoo_field_name = cls._sdk_field_mapping.get(name, name)
+            if cls._is_enum_field(field_type):
+                lines.append(f'    x = inst.{name}; v[{odoo_field_name!r}] = x.value if isinstance(x, Enum) else x')
+            elif odoo_field_name in cls._get_datetime_field_set():
+                lines.append(f'    x = inst.{name}; v[{odoo_field_name!r}] = self._parse_datetime(x) or x')
+            else:
+                lines.append(f'    v[{odoo_field_name!r}] = inst.{name}')
+        lines.append('    return v')
+        
+        namespace = {'Enum': Enum}
+        exec('\n'.join(lines), namespace)
+        return namespace['_to_vals']
+    
+    @staticmethod
+    def _is_enum_field(field_type) -> bool:
         """Check if a field type is an enum."""
-        try:
-            return isinstance(field_type, type) and issubclass(field_type, Enum)
-        except TypeError:
-            return False
+        # Enum classes are instances of EnumMeta; avoids the MRO walk and the
+        # TypeError handling issubclass() needs for typing constructs
+        return type(field_type) is EnumMeta
     
     def _parse_datetime(self, value: Any) -> Optional[datetime]:
         """Parse datetime from various formats using built-in datetime."""
-        if not value:
-            return None
-        
         if isinstance(value, datetime):
             return value
         
-        if isinstance(value, str):
-            # Common datetime formats to try
-            formats = [
-                '%Y-%m-%dT%H:%M:%S.%fZ',  # ISO format with microseconds and Z
-                '%Y-%m-%dT%H:%M:%SZ',     # ISO format without microseconds
-                '%Y-%m-%dT%H:%M:%S.%f',   # ISO format with microseconds, no Z
-                '%Y-%m-%dT%H:%M:%S',      # ISO format without microseconds, no Z
-                '%Y-%m-%d %H:%M:%S',      # Standard format
-                '%Y-%m-%d',               # Date only
-            ]
-            
-            for fmt in formats:
-                try:
-                    return datetime.strptime(value, fmt)
-                except ValueError:
-                    continue
-            
-            _logger.warning(f"Failed to parse datetime '{value}' with any known format")
+        if not value:
             return None
         
+        if isinstance(value, str):
+            parsed = _parse_dt_cached(value)
+            if parsed is None:
+                _logger.warning(f"Failed to parse datetime '{value}' with any known format")
+            return parsed
+        
         return None
     
+    @classmethod
+    def _get_datetime_field_set(cls):
+        """
+        Return the Odoo field names whose SDK values are parsed as datetimes.
+        
+        Classified by name (``*_at`` or containing ``date``) once per model
+        class and cached in its own ``__dict__``: Odoo builds registry classes
+        without running ``__init_subclass__``, so this is resolved lazily.
+        """
+        datetime_fields = cls.__dict__.get('_datetime_fields')
+        if datetime_fields is None:
+            odoo_field_names = (
+                cls._sdk_field_mapping.get(dc_field.name, dc_field.name)
+                for dc_field in dataclass_fields(cls._dataclass_type)
+            ) if cls._dataclass_type else ()
+            datetime_fields = frozenset(
+                name for name in odoo_field_names
+                if name.endswith('_at') or 'date' in name.lower()
+            )
+            cls._datetime_fields = datetime_fields
+        return datetime_fields
+    
+    @classmethod
+    def _get_dc_plan(cls):
+        """
+        Return the per-class conversion plan for ``_prepare_dataclass_data``.
+        
+        The plan is a tuple of ``(dc_field_name, odoo_field_name, is_enum,
+        enum_type, is_union, default)`` entries, built once from the dataclass
+        fields and the SDK mapping and cached on the model class.
+        """
+        plan = cls.__dict__.get('_dc_plan')
+        if plan is None:
+            plan = ()
+            if cls._dataclass_type:
+                # Reverse of the SDK mapping, resolved once with the plan
+                reverse_mapping = {v: k for k, v in cls._sdk_field_mapping.items()}
+                plan = tuple(
+                    (
+                        dc_field.name,
+                        reverse_mapping.get(dc_field.name, dc_field.name),
+                        cls._is_enum_field(dc_field.type),
+                        dc_field.type,
+                        getattr(dc_field.type, '__origin__', None) is Union,
+                        dc_field.default,
+                    )
+                    for dc_field in dataclass_fields(cls._dataclass_type)
+                )
+            cls._dc_plan = plan
+        return plan
+    
     def _prepare_dataclass_data(self) -> Dict[str, Any]:
         """Prepare data for dataclass creation"""
         data = {}
         
-        # Create reverse mapping for dataclass -> Odoo field lookup
-        reverse_mapping = {v: k for k, v in self._sdk_field_mapping.items()}
-        
-        # Get all dataclass fields
-        if self._dataclass_type:
-            dc_fields = {f.name: f for f in dataclass_fields(self._dataclass_type)}
-            
-            for dc_field_name, dc_field in dc_fields.items():
-                # Map dataclass field to Odoo field (reverse of the SDK mapping)
-                odoo_field_name = reverse_mapping.get(dc_field_name, dc_field_name)
-                
-                if hasattr(self, odoo_field_name):
-                    value = getattr(self, odoo_field_name)
-                    
-                    # Handle different field types
-                    if isinstance(value, models.BaseModel):
-                        # Many2one field
-                        if value:
-                            if hasattr(value, 'name'):
-                                data[dc_field_name] = value.name
-                            else:
-                                data[dc_field_name] = str(value.id)
+        for dc_field_name, odoo_field_name, is_enum, enum_type, is_union, default in self._get_dc_plan():
+            value = getattr(self, odoo_field_name, _MISSING)
+            if value is not _MISSING:
+                # Handle different field types
+                if isinstance(value, models.BaseModel):
+                    # Many2one field
+                    if value:
+                        if hasattr(value, 'name'):
+                            data[dc_field_name] = value.name
                         else:
-                            data[dc_field_name] = None
-                    elif self._is_enum_field(dc_field.type) and value:
-                        # Handle enum fields - convert string to enum
-                        try:
-                            data[dc_field_name] = dc_field.type(value)
-                        except (ValueError, TypeError):
-                            _logger.warning(f"Invalid enum value '{value}' for field {dc_field_name}")
-                            data[dc_field_name] = None
-                    elif hasattr(dc_field.type, '__origin__') and dc_field.type.__origin__ is Union:
-                        # Handle Optional fields
-                        data[dc_field_name] = value
-                    else:
-                        data[dc_field_name] = value
-                else:
-                    # Set default value if field doesn't exist
-                    if dc_field.default is not None:
-                        data[dc_field_name] = dc_field.default
+                            data[dc_field_name] = str(value.id)
                     else:
                         data[dc_field_name] = None
+                elif is_enum and value:
+                    # Handle enum fields - convert string to enum
+                    try:
+                        data[dc_field_name] = enum_type(value)
+                    except (ValueError, TypeError):
+                        _logger.warning(f"Invalid enum value '{value}' for field {dc_field_name}")
+                        data[dc_field_name] = None
+                else:
+                    # Optional (Union) and plain fields are passed through as-is
+                    data[dc_field_name] = value
+            else:
+                # Set default value if field doesn't exist
+                data[dc_field_name] = default
         
         return data
     
@@ -139,17 +336,36 @@ class TadaDataclassModelMixin(models.AbstractModel):
         data = self._prepare_dataclass_data()
         return self._dataclass_type(**data)
     
-    @api.model
-    def from_dataclass(self, dataclass_instance, company_id=None):
-        """Create Odoo record from SDK dataclass instance (plain text storage)."""
-        if not isinstance(dataclass_instance, self._dataclass_type):
-            raise ValueError(f"Expected {self._dataclass_type.__name__}, got {type(dataclass_instance).__name__}")
+    def _dataclass_to_vals(self, dataclass_instance) -> Dict[str, Any]:
+        """
+        Convert an SDK dataclass instance to Odoo field values.
         
-        data = asdict(dataclass_instance)
+        Pure conversion (enums, datetimes, field mapping) that does not touch
+        the database, so sync methods can build all values before writing.
+        """
+        to_vals = self._get_to_vals()
+        if to_vals is not None and type(dataclass_instance) is self._dataclass_type:
+            odoo_data = to_vals(self, dataclass_instance)
+        else:
+            odoo_data = self._dataclass_to_vals_generic(dataclass_instance)
+        
+        # Normalize inbound fiscal codes once here, so sync can skip the constraint.
+        # Syncs see the same code on many requests, so the memoized validator
+        # turns repeats into a cache lookup.
+        if odoo_data.get('fiscal_code'):
+            odoo_data['fiscal_code'] = validate_fiscal_code_cached(
+                odoo_data['fiscal_code'], raise_on_error=False
+            )
+        
+        return odoo_data
+    
+    def _dataclass_to_vals_generic(self, dataclass_instance) -> Dict[str, Any]:
+        """Field-by-field conversion used when no generated converter applies."""
         odoo_data = {}
+        datetime_fields = self._get_datetime_field_set()
         
-        # Convert dataclass data to Odoo format
-        for dc_field_name, value in data.items():
+        # Shallow attribute view - asdict() would deep-copy nested lists we skip anyway
+        for dc_field_name, value in vars(dataclass_instance).items():
             odoo_field_name = self._sdk_field_mapping.get(dc_field_name, dc_field_name)
             
             # Skip list/relationship fields - they should be handled by specific models
@@ -159,7 +375,7 @@ class TadaDataclassModelMixin(models.AbstractModel):
             if isinstance(value, Enum):
                 # Convert enum to string value
                 odoo_data[odoo_field_name] = value.value
-            elif odoo_field_name.endswith('_at') or 'date' in odoo_field_name.lower():
+            elif odoo_field_name in datetime_fields:
                 # Handle datetime fields
                 parsed_dt = self._parse_datetime(value)
                 if parsed_dt:
@@ -169,6 +385,17 @@ class TadaDataclassModelMixin(models.AbstractModel):
             else:
                 odoo_data[odoo_field_name] = value
         
+        return odoo_data
+    
+    @api.model
+    def from_dataclass(self, dataclass_instance, company_id=None):
+        """Create Odoo record from SDK dataclass instance (plain text storage)."""
+        if not isinstance(dataclass_instance, self._dataclass_type):
+            raise ValueError(f"Expected {self._dataclass_type.__name__}, got {type(dataclass_instance).__name__}")
+        
+        # Convert dataclass data to Odoo format
+        odoo_data = self._dataclass_to_vals(dataclass_instance)
+        
         # Set company
         if company_id:
             odoo_data['company_id'] = company_id
@@ -176,8 +403,9 @@ class TadaDataclassModelMixin(models.AbstractModel):
             odoo_data['company_id'] = self.env.company.id
         
         # Set timestamps
-        odoo_data['created_at'] = fields.Datetime.now()
-        odoo_data['updated_at'] = fields.Datetime.now()
+        now = fields.Datetime.now()
+        odoo_data['created_at'] = now
+        odoo_data['updated_at'] = now
         
         # Use create_or_update if available (for models with unique constraints)
         if hasattr(self, 'create_or_update'):
@@ -190,31 +418,148 @@ class TadaDataclassModelMixin(models.AbstractModel):
         if not isinstance(dataclass_instance, self._dataclass_type):
             raise ValueError(f"Expected {self._dataclass_type.__name__}, got {type(dataclass_instance).__name__}")
         
-        data = asdict(dataclass_instance)
-        odoo_data = {}
+        odoo_data = self._dataclass_to_vals(dataclass_instance)
+        odoo_data['updated_at'] = fields.Datetime.now()
+        self.write(odoo_data)
+    
+    @api.model
+    def _sync_partition(self, items, key_fields, company_id):
+        """
+        Split SDK items into the creates and updates of ``_sync_apply_batch``.
         
-        for dc_field_name, value in data.items():
-            odoo_field_name = self._sdk_field_mapping.get(dc_field_name, dc_field_name)
+        Existing records of the company are prefetched in one query and
+        matched on each key of ``key_fields`` in turn. Repeated entries for
+        one record are merged, the last one wins.
+        
+        Args:
+            items (list): SDK dataclass instances
+            key_fields (tuple): Field name tuples identifying a record, in
+                match order, e.g. ``(('request_id',), ('pod', 'serial'))``
+            company_id (int): Company the records belong to
             
-            # Skip list/relationship fields - they should be handled by specific models
-            if isinstance(value, list):
+        Returns:
+            tuple: (to_create, to_update, duplicate_count), ``to_update``
+                holding ``(record, vals)`` pairs
+        """
+        vals_list = [self._dataclass_to_vals(item) for item in items]
+        keys_list = [
+            [tuple(vals.get(name) for name in names) for names in key_fields]
+            for vals in vals_list
+        ]
+        
+        # Prefetch the ids of existing records for the whole batch in one
+        # query matching any key, reading only the key columns
+        key_domains = []
+        for index, names in enumerate(key_fields):
+            values = {keys[index] for keys in keys_list if all(keys[index])}
+            if values:
+                key_domains.append([
+                    (name, 'in', list({value[position] for value in values}))
+                    for position, name in enumerate(names)
+                ])
+        existing_maps = [{} for _names in key_fields]
+        if key_domains:
+            rows = self.search_read(
+                expression.AND([[_company_leaf(company_id)], expression.OR(key_domains)]),
+                list({name for names in key_fields for name in names})
+            )
+            for row in rows:
+                for index, names in enumerate(key_fields):
+                    existing_maps[index][tuple(row[name] for name in names)] = row['id']
+        
+        # Split the payload into creates and updates without touching the DB
+        now = fields.Datetime.now()
+        to_create = []
+        updates = {}
+        pending_maps = [{} for _names in key_fields]
+        duplicate_count = 0
+        for vals, keys in zip(vals_list, keys_list):
+            existing_id = _match_key(existing_maps, keys)
+            if existing_id:
+                # Models with a trigger stamp only the rows that really change
+                if not self._updated_at_trigger:
+                    vals['updated_at'] = now
+                updates.setdefault(existing_id, {}).update(vals)
                 continue
             
-            if isinstance(value, Enum):
-                # Convert enum to string value
-                odoo_data[odoo_field_name] = value.value
-            elif odoo_field_name.endswith('_at') or 'date' in odoo_field_name.lower():
-                # Handle datetime fields
-                parsed_dt = self._parse_datetime(value)
-                if parsed_dt:
-                    odoo_data[odoo_field_name] = parsed_dt
-                else:
-                    odoo_data[odoo_field_name] = value
-            else:
-                odoo_data[odoo_field_name] = value
+            pending = _match_key(pending_maps, keys)
+            if pending is not None:
+                pending.update(vals)
+                duplicate_count += 1
+                continue
+            
+            vals.update(company_id=company_id, created_at=now, updated_at=now)
+            to_create.append(vals)
+            for pending_map, key in zip(pending_maps, keys):
+                if all(key):
+                    pending_map[key] = vals
         
-        odoo_data['updated_at'] = fields.Datetime.now()
-        self.write(odoo_data)
+        to_update = [(self.browse(record_id), vals) for record_id, vals in updates.items()]
+        return to_create, to_update, duplicate_count
+    
+    def _sync_apply_batch(self, to_create, to_update):
+        """
+        Create and update synced records in bulk.
+        
+        Records are applied in chunks of ``_sync_chunk_size``, each in one
+        savepoint. If a chunk fails, only that chunk is replayed record by
+        record, each in its own savepoint, so a single bad record is skipped
+        instead of aborting the sync.
+        
+        Args:
+            to_create (list): Values for the records to create
+            to_update (list): ``(record, vals)`` pairs for the records to update
+            
+        Returns:
+            tuple: (created_count, updated_count, skipped_count)
+        """
+        size = self._sync_chunk_size
+        created_count = updated_count = skipped_count = 0
+        for start in range(0, len(to_create), size):
+            created, _updated, skipped = self._sync_apply_chunk(to_create[start:start + size], [])
+            created_count += created
+            skipped_count += skipped
+        for start in range(0, len(to_update), size):
+            _created, updated, skipped = self._sync_apply_chunk([], to_update[start:start + size])
+            updated_count += updated
+            skipped_count += skipped
+        
+        return created_count, updated_count, skipped_count
+    
+    def _sync_apply_chunk(self, to_create, to_update):
+        """Apply one chunk of ``_sync_apply_batch``, falling back to per-record savepoints."""
+        try:
+            with self.env.cr.savepoint():
+                if to_create:
+                    self.create(to_create)
+                for record, vals in to_update:
+                    record.write(vals)
+            return len(to_create), len(to_update), 0
+        except Exception as e:
+            _logger.warning(f"Batch sync of {self._name} failed ({e}), retrying record by record")
+        
+        # Field holding the API identifier, for log messages
+        id_field = self._sdk_field_mapping.get('id', 'id')
+        created_count = updated_count = skipped_count = 0
+        for vals in to_create:
+            try:
+                with self.env.cr.savepoint():
+                    self.create(vals)
+                created_count += 1
+            except Exception as e:
+                # The savepoint rolls back this individual record's changes
+                _logger.warning(f"Failed to sync {self._name} {vals.get(id_field, 'unknown')}: {str(e)}")
+                skipped_count += 1
+        for record, vals in to_update:
+            try:
+                with self.env.cr.savepoint():
+                    record.with_context(self.env.context).write(vals)
+                updated_count += 1
+            except Exception as e:
+                _logger.warning(f"Failed to sync {self._name} {vals.get(id_field, 'unknown')}: {str(e)}")
+                skipped_count += 1
+        
+        return created_count, updated_count, skipped_count
     
     def get_sdk_instance(self) -> Chain2GateSDK:
         """Get SDK instance configured for this company."""
@@ -226,18 +571,28 @@ class TadaDataclassModelMixin(models.AbstractModel):
         
         base_url = company.tada_base_url or "https://chain2-api.chain2gate.it"
         
-        # Log API configuration (without sensitive data)
-        log_api_call(
-            operation="SDK Instance Creation",
-            company=company.name,
-            base_url=base_url,
-            has_api_key=bool(company.tada_api_key)
-        )
+        cache = _get_sdk_cache()
+        cache_key = (self.env.cr.dbname, company.id, company.tada_api_key, base_url)
+        sdk = cache.get(cache_key)
+        if sdk is not None:
+            cache.move_to_end(cache_key)
+        else:
+            # Log API configuration (without sensitive data)
+            log_api_call(
+                operation="SDK Instance Creation",
+                company=company.name,
+                base_url=base_url,
+                has_api_key=bool(company.tada_api_key)
+            )
+            
+            sdk = cache[cache_key] = Chain2GateSDK(
+                api_key=company.tada_api_key,
+                base_url=base_url
+            )
+            if len(cache) > _SDK_CACHE_SIZE:
+                cache.popitem(last=False)
         
-        return Chain2GateSDK(
-            api_key=company.tada_api_key,
-            base_url=base_url
-        )
+        return sdk
     
     def _validate_company_access(self, operation="access"):
         """Validate that user can only access records from their company."""
@@ -259,17 +614,9 @@ class TadaDataclassModelMixin(models.AbstractModel):
     def search(self, args, offset=0, limit=None, order=None):
         """Override search to enforce company boundaries."""
         # Add company filter to search domain if not already present
-        has_company_filter = any(
-            isinstance(clause, (list, tuple)) and len(clause) >= 3 and clause[0] == 'company_id'
-            for clause in (args or [])
-        )
-        
-        if not has_company_filter:
-            company_domain = [('company_id', '=', self.env.company.id)]
-            if args:
-                args = company_domain + args
-            else:
-                args = company_domain
+        if not _has_company_filter(args):
+            company_leaf = _company_leaf(self.env.company.id)
+            args = [company_leaf, *args] if args else [company_leaf]
         
         return super().search(args, offset=offset, limit=limit, order=order)
     
@@ -277,17 +624,9 @@ class TadaDataclassModelMixin(models.AbstractModel):
     def search_count(self, args, limit=None):
         """Override search_count to enforce company boundaries."""
         # Add company filter to search domain if not already present
-        has_company_filter = any(
-            isinstance(clause, (list, tuple)) and len(clause) >= 3 and clause[0] == 'company_id'
-            for clause in (args or [])
-        )
-        
-        if not has_company_filter:
-            company_domain = [('company_id', '=', self.env.company.id)]
-            if args:
-                args = company_domain + args
-            else:
-                args = company_domain
+        if not _has_company_filter(args):
+            company_leaf = _company_leaf(self.env.company.id)
+            args = [company_leaf, *args] if args else [company_leaf]
         
         return super().search_count(args, limit=limit)
     
@@ -324,9 +663,29 @@ class TadaDataclassModelMixin(models.AbstractModel):
                         f"from '{old_company}' to '{new_company}' by user {self.env.user.name}"
                     )
         
-        vals['updated_at'] = fields.Datetime.now()
+        # Callers that pre-stamp (e.g. batch sync) keep their timestamp;
+        # copy rather than mutate the caller's dict. Models with a database
+        # trigger leave the stamp to Postgres.
+        if vals and 'updated_at' not in vals and not self._updated_at_trigger:
+            vals = dict(vals, updated_at=fields.Datetime.now())
         return super().write(vals)
     
+    def _is_noop_write(self, vals):
+        """Return True if writing ``vals`` would leave this record unchanged.
+        
+        Only plain stored fields are compared; anything else (x2many commands,
+        unknown keys) counts as a change. Models that see frequent identical
+        re-saves call it from ``write`` to skip them.
+        """
+        self.ensure_one()
+        for field_name, value in vals.items():
+            field = self._fields.get(field_name)
+            if field is None or not field.store or field.type in ('one2many', 'many2many'):
+                return False
+            if field.convert_to_cache(self[field_name], self) != field.convert_to_cache(value, self):
+                return False
+        return True
+    
     def unlink(self):
         """Override unlink to validate company access."""
         self._validate_company_access("delete")
@@ -348,6 +707,7 @@ class TadaDataclassModelMixin(models.AbstractModel):
     def create(self, vals_list):
         """Override create to ensure company consistency."""
         current_company_id = self.env.company.id
+        now = fields.Datetime.now()
         
         for vals in vals_list:
             # Set company_id if not provided
@@ -366,8 +726,8 @@ class TadaDataclassModelMixin(models.AbstractModel):
             
             # Set timestamps
             if 'created_at' not in vals:
-                vals['created_at'] = fields.Datetime.now()
+                vals['created_at'] = now
             if 'updated_at' not in vals:
-                vals['updated_at'] = fields.Datetime.now()
+                vals['updated_at'] = now
         
         return super().create(vals_list)
\ No newline at end of file
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Abstract mixin shared by the TADA POD request models.
+"""
+
+from odoo import models, api
+
+
+class TadaPodRequestMixin(models.AbstractModel):
+    """
+    Abstract mixin for the admissibility, association and disassociation
+    request models, whose records feed the POD summaries.
+    """
+    
+    _name = 'tada.pod.request.mixin'
+    _description = 'TADA POD Request Mixin'
+    _inherit = ['tada.dataclass.mixin']
+    
+    def _get_pod_summary_keys(self):
+        """Return the distinct (pod, fiscal_code, company_id) keys of these requests."""
+        return {(r.pod, r.fiscal_code, r.company_id.id) for r in self if r.pod and r.fiscal_code}
+    
+    @api.model
+    def _sync_pod_requests(self, requests, key_fields, company_id):
+        """
+        Sync SDK requests through the ORM, then recompute the POD summaries
+        they touch once for the whole batch.
+        
+        Args:
+            requests (list): SDK request dataclass instances
+            key_fields (tuple): Match keys, see ``_sync_partition``
+            company_id (int): Company the records belong to
+            
+        Returns:
+            tuple: (created_count, updated_count, skipped_count)
+        """
+        # One sync environment: _dataclass_to_vals already normalized the
+        # fiscal codes, so the constraints skip them; summaries are deferred
+        self_sync = self.with_context(skip_fiscal_code_validation=True, defer_pod_summary=True)
+        to_create, to_update, duplicate_count = self_sync._sync_partition(requests, key_fields, company_id)
+        
+        # Summary keys touched by the batch: the updated records before and
+        # after the write, plus the new records
+        update_records = self_sync.browse([record.id for record, _vals in to_update])
+        pod_keys = update_records._get_pod_summary_keys()
+        pod_keys.update((vals.get('pod'), vals.get('fiscal_code'), company_id) for vals in to_create)
+        
+        # Applied in chunks with one savepoint each; only a failing chunk
+        # is replayed record by record
+        created_count, updated_count, skipped_count = self_sync._sync_apply_batch(to_create, to_update)
+        pod_keys |= update_records._get_pod_summary_keys()
+        
+        self.env['tada_admin.pod.summary']._recompute_pod_summaries_for_requests(pod_keys)
+        
+        return created_count, updated_count + duplicate_count, skipped_count
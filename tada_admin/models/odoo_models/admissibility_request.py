@@ -3,12 +3,12 @@
 Odoo model for TADA Admissibility Requests with plain text storage.
 """
 
-from odoo import models, fields, api
+from odoo import models, fields, api, tools
 from odoo.exceptions import UserError, ValidationError
 import logging
 
 from ..sdk.chain2gate_sdk import AdmissibilityRequest, Status
-from ...utils.fiscal_code_validator import validate_fiscal_code
+from ...utils.fiscal_code_validator import validate_fiscal_code_cached
 
 _logger = logging.getLogger(__name__)
 
@@ -18,7 +18,7 @@ class TadaAdmissibilityRequest(models.Model):
     
     _name = 'tada.admissibility.request'
     _description = 'TADA Admissibility Request'
-    _inherit = ['tada.dataclass.mixin']
+    _inherit = ['tada.pod.request.mixin']
     _rec_name = 'pod'
     _order = 'created_at desc'
     
@@ -55,27 +55,29 @@ class TadaAdmissibilityRequest(models.Model):
         ('pod_company_unique', 'UNIQUE(pod, company_id)', 'POD must be unique per company!'),
     ]
     
+    def init(self):
+        """Create the composite index behind per-customer lookups."""
+        super().init()
+        tools.create_index(
+            self.env.cr, 'tada_adm_req_fc_company_idx', self._table,
+            ['fiscal_code', 'company_id']
+        )
+    
     @api.constrains('fiscal_code')
     def _check_fiscal_code(self):
         """Validate fiscal code format."""
+        if self.env.context.get('skip_fiscal_code_validation'):
+            return
+        
         for record in self:
             if record.fiscal_code:
-                # Check if we're in an API sync context (non-blocking mode)
-                is_api_sync = self.env.context.get('skip_fiscal_code_validation', False)
-                
                 try:
-                    normalized_fiscal_code = validate_fiscal_code(
-                        record.fiscal_code, 
-                        raise_on_error=not is_api_sync
-                    )
+                    normalized_fiscal_code = validate_fiscal_code_cached(record.fiscal_code)
                     # Update the field with normalized value if different
                     if normalized_fiscal_code != record.fiscal_code:
                         record.fiscal_code = normalized_fiscal_code
                 except ValidationError as e:
-                    if not is_api_sync:
-                        raise ValidationError(f"Invalid fiscal code '{record.fiscal_code}': {str(e)}")
-                    # In API sync mode, just log the error and continue
-                    _logger.warning(f"Skipping validation for invalid fiscal code '{record.fiscal_code}': {str(e)}")
+                    raise ValidationError(f"Invalid fiscal code '{record.fiscal_code}': {str(e)}")
     
     @api.model
     def sync_from_api(self, company_id=None):
@@ -87,45 +89,11 @@ class TadaAdmissibilityRequest(models.Model):
             if isinstance(requests, dict) and requests.get('error'):
                 raise UserError(f"API Error: {requests.get('message', 'Unknown error')}")
             
-            synced_count = 0
-            updated_count = 0
-            skipped_count = 0
             current_company_id = company_id or self.env.company.id
             
-            # Use context to skip fiscal code validation during sync
-            sync_context = self.env.context.copy()
-            sync_context['skip_fiscal_code_validation'] = True
-            
-            for request in requests:
-                # Use a savepoint for each record to handle individual failures
-                try:
-                    with self.env.cr.savepoint():
-                        # First try to find by request_id within company
-                        existing = self.with_context(sync_context).search([
-                            ('request_id', '=', request.id),
-                            ('company_id', '=', current_company_id)
-                        ], limit=1)
-                        
-                        # If not found by request_id, try to find by POD and company
-                        if not existing and hasattr(request, 'pod'):
-                            existing = self.with_context(sync_context).search([
-                                ('pod', '=', request.pod),
-                                ('company_id', '=', current_company_id)
-                            ], limit=1)
-                        
-                        if existing:
-                            existing.with_context(sync_context).update_from_dataclass(request)
-                            updated_count += 1
-                        else:
-                            self.with_context(sync_context).from_dataclass(request, current_company_id)
-                            synced_count += 1
-                            
-                except Exception as e:
-                    # Log the error but continue with other records
-                    # The savepoint automatically rolls back this individual record's changes
-                    _logger.warning(f"Failed to sync admissibility request {getattr(request, 'id', 'unknown')}: {str(e)}")
-                    skipped_count += 1
-                    continue
+            synced_count, updated_count, skipped_count = self._sync_pod_requests(
+                requests, (('request_id',), ('pod',)), current_company_id
+            )
             
             message = f'Synced {synced_count} new and updated {updated_count} admissibility requests'
             if skipped_count > 0:
@@ -224,26 +192,15 @@ class TadaAdmissibilityRequest(models.Model):
         
         return self.create(vals)
     
-    @api.model_create_multi
-    def create(self, vals_list):
-        """Override create to set created_at if not provided."""
-        for vals in vals_list:
-            if 'created_at' not in vals:
-                vals['created_at'] = fields.Datetime.now()
-        return super().create(vals_list)
-    
     def write(self, vals):
-        """Override write to set updated_at and trigger POD summary recomputation."""
-        vals['updated_at'] = fields.Datetime.now()
+        """Override write to trigger POD summary recomputation (the mixin sets updated_at)."""
         result = super().write(vals)
         
         # Trigger POD summary recomputation if relevant fields changed
         if any(field in vals for field in ['pod', 'fiscal_code', 'status', 'company_id']):
-            for record in self:
-                if record.pod and record.fiscal_code:
-                    self.env['tada_admin.pod.summary']._recompute_pod_summaries_for_request(
-                        record.pod, record.fiscal_code, record.company_id.id
-                    )
+            self.env['tada_admin.pod.summary']._recompute_pod_summaries_for_requests(
+                self._get_pod_summary_keys()
+            )
         
         return result
     
@@ -252,26 +209,21 @@ class TadaAdmissibilityRequest(models.Model):
         """Override create to trigger POD summary recomputation."""
         records = super().create(vals_list)
         
-        # Trigger POD summary recomputation for new records
-        for record in records:
-            if record.pod and record.fiscal_code:
-                self.env['tada_admin.pod.summary']._recompute_pod_summaries_for_request(
-                    record.pod, record.fiscal_code, record.company_id.id
-                )
+        # Trigger POD summary recomputation once for all new records
+        self.env['tada_admin.pod.summary']._recompute_pod_summaries_for_requests(
+            records._get_pod_summary_keys()
+        )
         
         return records
     
     def unlink(self):
         """Override unlink to trigger POD summary recomputation."""
         # Store info before deletion
-        pod_info = [(r.pod, r.fiscal_code, r.company_id.id) for r in self if r.pod and r.fiscal_code]
+        pod_keys = self._get_pod_summary_keys()
         
         result = super().unlink()
         
         # Trigger recomputation after deletion
-        for pod, fiscal_code, company_id in pod_info:
-            self.env['tada_admin.pod.summary']._recompute_pod_summaries_for_request(
-                pod, fiscal_code, company_id
-            )
+        self.env['tada_admin.pod.summary']._recompute_pod_summaries_for_requests(pod_keys)
         
-        return result
\ No newline at end of file
+        return result
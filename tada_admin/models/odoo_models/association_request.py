@@ -3,23 +3,30 @@
 Odoo model for TADA Association Requests with plain text storage.
 """
 
-from odoo import models, fields, api
-from odoo.exceptions import UserError, ValidationError
+from odoo import models, fields, api, tools
+from odoo.exceptions import AccessError, UserError, ValidationError
 import logging
 
 from ..sdk.chain2gate_sdk import AssociationRequest, Status, PodMType, UserType
-from ...utils.fiscal_code_validator import validate_fiscal_code
+from ...utils.fiscal_code_validator import validate_fiscal_code_cached
 from ...utils.api_error_handler import with_api_error_handling, log_api_call
 
 _logger = logging.getLogger(__name__)
 
+# Columns mirrored from the API payload by the bulk upsert
+_UPSERT_FIELDS = (
+    'request_id', 'pod', 'serial', 'request_type', 'pod_m_type', 'user_type',
+    'first_name', 'last_name', 'email', 'contract_signed', 'product', 'status',
+    'message', 'fiscal_code', 'closed_at', 'group',
+)
+
 
 class TadaAssociationRequest(models.Model):
     """Odoo model for TADA Association Requests with plain text storage."""
     
     _name = 'tada.association.request'
     _description = 'TADA Association Request'
-    _inherit = ['tada.dataclass.mixin']
+    _inherit = ['tada.pod.request.mixin']
     _rec_name = 'pod'
     _order = 'created_at desc'
     
@@ -79,8 +86,11 @@ class TadaAssociationRequest(models.Model):
     customer_id = fields.Many2one('tada.customer', string='Customer', 
                                  help='Related customer record')
     
-    # Display name computed field
-    display_name = fields.Char(string='Display Name', compute='_compute_display_name', store=False)
+    # Display name computed field, stored so list views read it with the row
+    display_name = fields.Char(string='Display Name', compute='_compute_display_name', store=True)
+    
+    # updated_at is maintained by the tada_set_updated_at trigger, see init()
+    _updated_at_trigger = True
     
     # Constraints
     _sql_constraints = [
@@ -89,42 +99,99 @@ class TadaAssociationRequest(models.Model):
          'POD and Serial combination must be unique per company!'),
     ]
     
+    def init(self):
+        """Create the composite indexes behind the company-scoped list order and
+        per-customer lookups."""
+        super().init()
+        tools.create_index(
+            self.env.cr, 'tada_assoc_req_company_created_idx', self._table,
+            ['company_id', 'created_at DESC']
+        )
+        tools.create_index(
+            self.env.cr, 'tada_assoc_req_fc_company_idx', self._table,
+            ['fiscal_code', 'company_id']
+        )
+        
+        # Stamp updated_at only when the writer did not set it explicitly
+        self.env.cr.execute("""
+            CREATE OR REPLACE FUNCTION tada_set_updated_at() RETURNS trigger AS $$
+            BEGIN
+                IF NEW.updated_at IS NOT DISTINCT FROM OLD.updated_at THEN
+                    NEW.updated_at := (now() AT TIME ZONE 'UTC');
+                END IF;
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql
+        """)
+        # and only when a real column changed: the WHEN condition compares the
+        # stored columns directly, Odoo's own write_date/write_uid do not count
+        columns = [
+            name for name, field in self._fields.items()
+            if field.store and field.column_type
+            and name not in ('id', 'updated_at', 'write_date', 'write_uid')
+        ]
+        old_row = ', '.join(f'OLD."{name}"' for name in columns)
+        new_row = ', '.join(f'NEW."{name}"' for name in columns)
+        self.env.cr.execute(f"""
+            DROP TRIGGER IF EXISTS tada_assoc_req_updated_at ON "{self._table}";
+            CREATE TRIGGER tada_assoc_req_updated_at BEFORE UPDATE ON "{self._table}"
+            FOR EACH ROW WHEN (ROW({old_row}) IS DISTINCT FROM ROW({new_row}))
+            EXECUTE FUNCTION tada_set_updated_at()
+        """)
+    
     @api.constrains('fiscal_code')
     def _check_fiscal_code(self):
         """Validate fiscal code format."""
+        if self.env.context.get('skip_fiscal_code_validation'):
+            return
+        
         for record in self:
             if record.fiscal_code:
-                # Check if we're in an API sync context (non-blocking mode)
-                is_api_sync = self.env.context.get('skip_fiscal_code_validation', False)
-                
                 try:
-                    normalized_fiscal_code = validate_fiscal_code(
-                        record.fiscal_code, 
-                        raise_on_error=not is_api_sync
-                    )
+                    normalized_fiscal_code = validate_fiscal_code_cached(record.fiscal_code)
                     # Update the field with normalized value if different
                     if normalized_fiscal_code != record.fiscal_code:
                         record.fiscal_code = normalized_fiscal_code
                 except ValidationError as e:
-                    if not is_api_sync:
-                        raise ValidationError(f"Invalid fiscal code '{record.fiscal_code}': {str(e)}")
-                    # In API sync mode, just log the error and continue
-                    _logger.warning(f"Skipping validation for invalid fiscal code '{record.fiscal_code}': {str(e)}")
+                    raise ValidationError(f"Invalid fiscal code '{record.fiscal_code}': {str(e)}")
+    
+    @staticmethod
+    def _suggest_user_type(pod_m_type):
+        """Return the user type suggested by a POD M type, or False."""
+        if pod_m_type == 'M1':
+            # M1 is typically for consumption only
+            return 'CONSUMER'
+        if pod_m_type in ['M2', 'M2_2', 'M2_3', 'M2_4']:
+            # M2 types are typically for production
+            return 'PROSUMER'
+        return False
+    
+    @api.onchange('pod_m_type')
+    def _onchange_pod_m_type(self):
+        """Update user type suggestion based on POD M type."""
+        if not self.user_type:
+            self.user_type = self._suggest_user_type(self.pod_m_type)
+    
+    @staticmethod
+    def _format_display_name(first_name, last_name, pod, serial):
+        """Build the display name from the request's name and POD fields."""
+        name_parts = []
+        if first_name:
+            name_parts.append(first_name)
+        if last_name:
+            name_parts.append(last_name)
+        
+        if name_parts:
+            return f"{' '.join(name_parts)} ({pod})"
+        return pod or serial or 'Association Request'
     
-    @api.depends('first_name', 'last_name', 'pod')
+    @api.depends('first_name', 'last_name', 'pod', 'serial')
     def _compute_display_name(self):
         """Compute display name for better UX."""
         for record in self:
-            name_parts = []
-            if record.first_name:
-                name_parts.append(record.first_name)
-            if record.last_name:
-                name_parts.append(record.last_name)
-            
-            if name_parts:
-                record.display_name = f"{' '.join(name_parts)} ({record.pod})"
-            else:
-                record.display_name = record.pod or record.serial or 'Association Request'
+            record.display_name = self._format_display_name(
+                record.first_name, record.last_name, record.pod, record.serial
+            )
     
     @api.model
     @with_api_error_handling("Sync association requests from API", max_retries=3)
@@ -139,46 +206,23 @@ class TadaAssociationRequest(models.Model):
         
         requests = sdk.get_association_requests()
         
-        synced_count = 0
-        updated_count = 0
-        skipped_count = 0
         current_company_id = company_id or self.env.company.id
         
-        # Use context to skip fiscal code validation during sync
-        sync_context = self.env.context.copy()
-        sync_context['skip_fiscal_code_validation'] = True
-        
-        for request in requests:
-            # Use a savepoint for each record to handle individual failures
-            try:
-                with self.env.cr.savepoint():
-                    # First try to find by request_id within company
-                    existing = self.with_context(sync_context).search([
-                        ('request_id', '=', request.id),
-                        ('company_id', '=', current_company_id)
-                    ], limit=1)
-                    
-                    # If not found by request_id, try to find by POD, serial and company
-                    if not existing and hasattr(request, 'pod') and hasattr(request, 'serial'):
-                        existing = self.with_context(sync_context).search([
-                            ('pod', '=', request.pod),
-                            ('serial', '=', request.serial),
-                            ('company_id', '=', current_company_id)
-                        ], limit=1)
-                    
-                    if existing:
-                        existing.with_context(sync_context).update_from_dataclass(request)
-                        updated_count += 1
-                    else:
-                        self.with_context(sync_context).from_dataclass(request, current_company_id)
-                        synced_count += 1
-                        
-            except Exception as e:
-                # Log the error but continue with other records
-                # The savepoint automatically rolls back this individual record's changes
-                _logger.warning(f"Failed to sync association request {getattr(request, 'id', 'unknown')}: {str(e)}")
-                skipped_count += 1
-                continue
+        # Fast path: mirror the payload with INSERT ... ON CONFLICT
+        try:
+            with self.env.cr.savepoint():
+                synced_count, updated_count, skipped_count, records = self._bulk_upsert_from_sdk(
+                    requests, current_company_id
+                )
+        except AccessError:
+            raise
+        except Exception as e:
+            _logger.warning(f"Bulk upsert of association requests failed ({e}), falling back to ORM sync")
+            synced_count, updated_count, skipped_count = self._sync_from_sdk_orm(requests, current_company_id)
+        else:
+            self.env['tada_admin.pod.summary']._recompute_pod_summaries_for_requests(
+                records._get_pod_summary_keys()
+            )
         
         message = f'Synced {synced_count} new and updated {updated_count} association requests'
         if skipped_count > 0:
@@ -193,6 +237,108 @@ class TadaAssociationRequest(models.Model):
             }
         }
     
+    @api.model
+    def _sync_from_sdk_orm(self, requests, current_company_id):
+        """
+        Sync SDK association requests through the ORM.
+        
+        Matches existing records by request_id and by POD/serial, which the
+        bulk upsert cannot do.
+        
+        Returns:
+            tuple: (created_count, updated_count, skipped_count)
+        """
+        return self._sync_pod_requests(requests, (('request_id',), ('pod', 'serial')), current_company_id)
+    
+    @api.model
+    def _bulk_upsert_from_sdk(self, requests, company_id):
+        """
+        Mirror SDK association requests with ``INSERT ... ON CONFLICT``.
+        
+        Bypasses the ORM, so callers must run it in a savepoint and fall back
+        to ``_sync_from_sdk_orm`` if it fails (e.g. on a POD/serial conflict).
+        The access checks the ORM would make are done up front, and requests
+        with an invalid fiscal code are skipped since no constraint runs.
+        
+        Args:
+            requests (list): AssociationRequest dataclass instances
+            company_id (int): Company the records belong to
+            
+        Returns:
+            tuple: (created_count, updated_count, skipped_count, records)
+            
+        Raises:
+            AccessError: If the user may not create and write these records
+                or does not belong to ``company_id``
+        """
+        self.check_access_rights('create')
+        self.check_access_rights('write')
+        if company_id not in self.env.user.company_ids.ids:
+            raise AccessError(
+                f"You cannot create records for company ID {company_id} "
+                f"because you don't have access to that company."
+            )
+        
+        now = fields.Datetime.now()
+        uid = self.env.uid
+        # Keyed by request_id: ON CONFLICT cannot update one row twice per statement
+        rows_by_request_id = {}
+        skipped_count = 0
+        for request in requests:
+            vals = self._dataclass_to_vals(request)
+            try:
+                validate_fiscal_code_cached(vals.get('fiscal_code'))
+            except ValidationError as e:
+                _logger.warning(f"Skipping association request {vals.get('request_id')}: {e}")
+                skipped_count += 1
+                continue
+            # display_name is stored, so the upsert has to fill it like the compute would
+            display_name = self._format_display_name(
+                vals.get('first_name'), vals.get('last_name'), vals.get('pod'), vals.get('serial')
+            )
+            rows_by_request_id[vals['request_id']] = tuple(vals.get(name) for name in _UPSERT_FIELDS) + (
+                display_name, company_id, now, now, uid, now, uid, now
+            )
+        rows = list(rows_by_request_id.values())
+        
+        columns = _UPSERT_FIELDS + (
+            'display_name', 'company_id', 'created_at', 'updated_at',
+            'create_uid', 'create_date', 'write_uid', 'write_date'
+        )
+        column_sql = ', '.join(f'"{column}"' for column in columns)
+        update_sql = ', '.join(
+            f'"{column}" = EXCLUDED."{column}"'
+            # updated_at is left to the trigger, so unchanged rows keep theirs
+            for column in _UPSERT_FIELDS + ('display_name', 'write_uid', 'write_date')
+        )
+        
+        self.flush_model()
+        record_ids = []
+        created_count = 0
+        size = self._sync_chunk_size
+        for start in range(0, len(rows), size):
+            chunk = rows[start:start + size]
+            self.env.cr.execute(
+                f'INSERT INTO "{self._table}" ({column_sql}) VALUES {", ".join(["%s"] * len(chunk))} '
+                f'ON CONFLICT (request_id, company_id) DO UPDATE SET {update_sql} '
+                f'RETURNING id, (xmax = 0)',
+                chunk
+            )
+            for record_id, inserted in self.env.cr.fetchall():
+                record_ids.append(record_id)
+                created_count += inserted
+        # Only the upserted rows and the columns the statement set are stale;
+        # mark them modified too, so stored computes depending on them
+        # (e.g. customer status and counts) are recomputed
+        records = self.browse(record_ids)
+        upserted_fields = list(_UPSERT_FIELDS) + ['display_name', 'updated_at', 'write_uid', 'write_date']
+        records.invalidate_recordset(upserted_fields)
+        records.modified(upserted_fields)
+        
+        # Repeated payload entries count as updates, like in the ORM path
+        updated_count = len(requests) - skipped_count - created_count
+        return created_count, updated_count, skipped_count, records
+    
     @with_api_error_handling("Create association request via API", max_retries=2)
     def create_api_request(self):
         """Create association request via API."""
@@ -292,56 +438,53 @@ class TadaAssociationRequest(models.Model):
         for vals in vals_list:
             if 'created_at' not in vals:
                 vals['created_at'] = fields.Datetime.now()
+            # Default a missing user type from the POD M type; explicit values are kept
+            if not vals.get('user_type'):
+                suggested = self._suggest_user_type(vals.get('pod_m_type'))
+                if suggested:
+                    vals['user_type'] = suggested
         
         records = super().create(vals_list)
         
-        # Trigger POD summary recomputation for new records
-        for record in records:
-            if record.pod and record.fiscal_code:
-                self.env['tada_admin.pod.summary']._recompute_pod_summaries_for_request(
-                    record.pod, record.fiscal_code, record.company_id.id
-                )
+        # Trigger POD summary recomputation once for all new records
+        self.env['tada_admin.pod.summary']._recompute_pod_summaries_for_requests(
+            records._get_pod_summary_keys()
+        )
         
         return records
     
     def unlink(self):
         """Override unlink to trigger POD summary recomputation."""
         # Store info before deletion
-        pod_info = [(r.pod, r.fiscal_code, r.company_id.id) for r in self if r.pod and r.fiscal_code]
+        pod_keys = self._get_pod_summary_keys()
         
         result = super().unlink()
         
         # Trigger recomputation after deletion
-        for pod, fiscal_code, company_id in pod_info:
-            self.env['tada_admin.pod.summary']._recompute_pod_summaries_for_request(
-                pod, fiscal_code, company_id
-            )
+        self.env['tada_admin.pod.summary']._recompute_pod_summaries_for_requests(pod_keys)
         
         return result
     
     def write(self, vals):
-        """Override write to set updated_at and trigger POD summary recomputation."""
-        vals['updated_at'] = fields.Datetime.now()
+        """Override write to trigger POD summary recomputation (the trigger sets updated_at)."""
+        if not any(field in vals for field in ['pod', 'fiscal_code', 'status', 'company_id']):
+            result = super().write(vals)
+            self._invalidate_trigger_updated_at(vals)
+            return result
+        
+        # Summaries keyed by the old values need a refresh too when a key field moves
+        pod_keys = self._get_pod_summary_keys()
         result = super().write(vals)
+        self._invalidate_trigger_updated_at(vals)
+        if any(field in vals for field in ['pod', 'fiscal_code', 'company_id']):
+            pod_keys |= self._get_pod_summary_keys()
         
-        # Trigger POD summary recomputation if relevant fields changed
-        if any(field in vals for field in ['pod', 'fiscal_code', 'status', 'company_id']):
-            for record in self:
-                if record.pod and record.fiscal_code:
-                    self.env['tada_admin.pod.summary']._recompute_pod_summaries_for_request(
-                        record.pod, record.fiscal_code, record.company_id.id
-                    )
+        self.env['tada_admin.pod.summary']._recompute_pod_summaries_for_requests(pod_keys)
         
         return result
     
-    @api.onchange('pod_m_type')
-    def _onchange_pod_m_type(self):
-        """Update user type suggestion based on POD M type."""
-        if self.pod_m_type == 'M1':
-            # M1 is typically for consumption only
-            if not self.user_type:
-                self.user_type = 'CONSUMER'
-        elif self.pod_m_type in ['M2', 'M2_2', 'M2_3', 'M2_4']:
-            # M2 types are typically for production
-            if not self.user_type:
-                self.user_type = 'PROSUMER'
\ No newline at end of file
+    def _invalidate_trigger_updated_at(self, vals):
+        """Flush the write so the trigger runs, then drop the cached updated_at."""
+        if vals and 'updated_at' not in vals:
+            self.flush_recordset()
+            self.invalidate_recordset(['updated_at'], flush=False)
@@ -1,8 +1,22 @@
 # -*- coding: utf-8 -*-
 
-from odoo import models, fields, api
+from types import MappingProxyType
+
+from odoo import models, fields, api, tools
 from odoo.exceptions import ValidationError
 
+# Permission types and the boolean fields that grant them
+_PERM_FIELD_MAP = MappingProxyType({
+    'PARTNER_ENERGIA': 'is_partner_energia',
+    'CONFIGURAZIONE_AMMISSIBILITA': 'has_configurazione_ammissibilita',
+    'CONFIGURAZIONE_ASSOCIAZIONE': 'has_configurazione_associazione',
+    'MAGAZZINO': 'has_magazzino',
+    'SPEDIZIONE': 'has_spedizione',
+    'MONITORAGGIO': 'has_monitoraggio',
+})
+_VALID_PERMS = frozenset(_PERM_FIELD_MAP)
+_PERM_FIELDS = frozenset(_PERM_FIELD_MAP.values())
+
 
 class CompanyPermissions(models.Model):
     _name = 'tada_admin.company.permissions'
@@ -98,13 +112,24 @@ class CompanyPermissions(models.Model):
             vals['created_date'] = now
             vals['modified_by'] = user_id
             
-        return super(CompanyPermissions, self).create(vals_list)
+        records = super(CompanyPermissions, self).create(vals_list)
+        # Drop cached get_company_permissions results
+        self.env.registry.clear_cache()
+        return records
 
     def write(self, vals):
         """Override write to update audit fields"""
         vals['last_modified'] = fields.Datetime.now()
         vals['modified_by'] = self.env.user.id
-        return super(CompanyPermissions, self).write(vals)
+        result = super(CompanyPermissions, self).write(vals)
+        self.env.registry.clear_cache()
+        return result
+
+    def unlink(self):
+        """Override unlink to drop cached permissions"""
+        result = super(CompanyPermissions, self).unlink()
+        self.env.registry.clear_cache()
+        return result
 
     @api.constrains('company_id')
     def _check_company_exists(self):
@@ -115,6 +140,7 @@ class CompanyPermissions(models.Model):
             if not record.company_id.active:
                 raise ValidationError("Cannot create permissions for inactive company.")
 
+    @api.model
     def get_company_permissions(self, company_id):
         """
         Get permissions for a specific company
@@ -125,6 +151,18 @@ class CompanyPermissions(models.Model):
         Returns:
             dict: Dictionary with permission flags
         """
+        # Copy so callers cannot alter the cached value
+        return dict(self._get_company_permissions_cached(company_id))
+
+    @api.model
+    @tools.ormcache('company_id', 'self.env.uid', 'self.env.su', 'tuple(self.env.companies.ids)')
+    def _get_company_permissions_cached(self, company_id):
+        """
+        Cached lookup behind get_company_permissions, cleared on any change.
+        
+        The search is subject to the multi-company record rule, so the result
+        depends on the user and their active companies, which are part of the key.
+        """
         permission_record = self.search([('company_id', '=', company_id)], limit=1)
         
         if not permission_record:
@@ -161,33 +199,12 @@ class CompanyPermissions(models.Model):
         Raises:
             ValidationError: If permission_type is invalid
         """
-        valid_permissions = [
-            'PARTNER_ENERGIA',
-            'CONFIGURAZIONE_AMMISSIBILITA', 
-            'CONFIGURAZIONE_ASSOCIAZIONE',
-            'MAGAZZINO',
-            'SPEDIZIONE',
-            'MONITORAGGIO'
-        ]
-        if permission_type not in valid_permissions:
+        if permission_type not in _VALID_PERMS:
             raise ValidationError(f"Invalid permission type: {permission_type}")
         
-        permissions = self.get_company_permissions(company_id)
-        
-        # Map permission types to field names
-        permission_field_mapping = {
-            'PARTNER_ENERGIA': 'is_partner_energia',
-            'CONFIGURAZIONE_AMMISSIBILITA': 'has_configurazione_ammissibilita',
-            'CONFIGURAZIONE_ASSOCIAZIONE': 'has_configurazione_associazione',
-            'MAGAZZINO': 'has_magazzino',
-            'SPEDIZIONE': 'has_spedizione',
-            'MONITORAGGIO': 'has_monitoraggio'
-        }
-        
-        permission_key = permission_field_mapping.get(permission_type)
-        if not permission_key:
-            raise ValidationError(f"No field mapping for permission type: {permission_type}")
+        permissions = self._get_company_permissions_cached(company_id)
         
+        permission_key = _PERM_FIELD_MAP[permission_type]
         return permissions.get(permission_key, False)
 
     def set_company_permissions(self, company_id, permissions_dict):
@@ -204,16 +221,8 @@ class CompanyPermissions(models.Model):
         existing_record = self.search([('company_id', '=', company_id)], limit=1)
         
         # Validate permission keys
-        valid_keys = [
-            'is_partner_energia',
-            'has_configurazione_ammissibilita',
-            'has_configurazione_associazione',
-            'has_magazzino',
-            'has_spedizione',
-            'has_monitoraggio'
-        ]
         for key in permissions_dict:
-            if key not in valid_keys:
+            if key not in _PERM_FIELDS:
                 raise ValidationError(f"Invalid permission key: {key}")
         
         if existing_record:
@@ -226,6 +235,44 @@ class CompanyPermissions(models.Model):
             vals.update(permissions_dict)
             return self.create(vals)
 
+    @api.model
+    def set_many(self, permissions_by_company):
+        """
+        Set permissions for several companies at once (create or update)
+        
+        Args:
+            permissions_by_company (dict): Permission flags dict per company ID
+            
+        Returns:
+            recordset: The created and updated permission records
+        """
+        for permissions_dict in permissions_by_company.values():
+            for key in permissions_dict:
+                if key not in _PERM_FIELDS:
+                    raise ValidationError(f"Invalid permission key: {key}")
+        
+        existing = {
+            record.company_id.id: record
+            for record in self.search([('company_id', 'in', list(permissions_by_company))])
+        }
+        
+        # Companies receiving identical flags are updated with a single write
+        updates = {}
+        for company_id, record in existing.items():
+            key = tuple(sorted(permissions_by_company[company_id].items()))
+            updates[key] = updates.get(key, self.browse()) | record
+        for records in updates.values():
+            records.write(permissions_by_company[records[:1].company_id.id])
+        
+        to_create = [
+            dict(permissions_dict, company_id=company_id)
+            for company_id, permissions_dict in permissions_by_company.items()
+            if company_id not in existing
+        ]
+        created = self.create(to_create) if to_create else self.browse()
+        
+        return created.union(*existing.values())
+
     @api.model
     def get_companies_with_permission(self, permission_type):
         """
@@ -237,32 +284,11 @@ class CompanyPermissions(models.Model):
         Returns:
             recordset: Companies with the specified permission
         """
-        valid_permissions = [
-            'PARTNER_ENERGIA',
-            'CONFIGURAZIONE_AMMISSIBILITA', 
-            'CONFIGURAZIONE_ASSOCIAZIONE',
-            'MAGAZZINO',
-            'SPEDIZIONE',
-            'MONITORAGGIO'
-        ]
-        if permission_type not in valid_permissions:
+        if permission_type not in _VALID_PERMS:
             raise ValidationError(f"Invalid permission type: {permission_type}")
         
-        # Map permission types to field names
-        permission_field_mapping = {
-            'PARTNER_ENERGIA': 'is_partner_energia',
-            'CONFIGURAZIONE_AMMISSIBILITA': 'has_configurazione_ammissibilita',
-            'CONFIGURAZIONE_ASSOCIAZIONE': 'has_configurazione_associazione',
-            'MAGAZZINO': 'has_magazzino',
-            'SPEDIZIONE': 'has_spedizione',
-            'MONITORAGGIO': 'has_monitoraggio'
-        }
-        
-        permission_field = permission_field_mapping.get(permission_type)
-        if not permission_field:
-            raise ValidationError(f"No field mapping for permission type: {permission_type}")
-        
-        domain = [(permission_field, '=', True)]
+        permission_field = _PERM_FIELD_MAP[permission_type]
         
-        permission_records = self.search(domain)
-        return permission_records.mapped('company_id')
\ No newline at end of file
+        # search() applies the multi-company record rule; company_id is read
+        # for the whole result in one prefetch and de-duplicated
+        return self.search([(permission_field, '=', True)]).company_id
\ No newline at end of file
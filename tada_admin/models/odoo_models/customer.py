@@ -6,14 +6,20 @@ Odoo model for TADA Customer with plain text storage and aggregated data.
 from odoo import models, fields, api
 from odoo.exceptions import UserError, ValidationError
 import logging
+from collections import defaultdict
 
 from ..sdk.chain2gate_sdk import Customer, UserType
-from ...utils.fiscal_code_validator import validate_fiscal_code, check_fiscal_code_uniqueness
+from ...utils.fiscal_code_validator import validate_fiscal_code_cached, check_fiscal_code_uniqueness
 from ...utils.api_error_handler import with_api_error_handling, log_api_call
 from ...utils.multi_company_validator import MultiCompanyValidator, ensure_company_isolation
 
 _logger = logging.getLogger(__name__)
 
+# Customer dataclass fields holding related records, handled separately from the customer values
+_RELATIONSHIP_FIELDS = frozenset([
+    'admissibility_requests', 'association_requests', 'disassociation_requests', 'devices',
+])
+
 
 class TadaCustomer(models.Model):
     """Odoo model for TADA Customer with plain text storage and aggregated data."""
@@ -26,6 +32,7 @@ class TadaCustomer(models.Model):
     
     # SDK integration configuration
     _dataclass_type = Customer
+    _local_sync_chunk_size = 500  # Customers built and written per pass in _sync_all_customers
     
     # Plain text fields
     fiscal_code = fields.Char(string='Fiscal Code', required=True, index=True,
@@ -65,21 +72,22 @@ class TadaCustomer(models.Model):
         string='Associated Devices'
     )
     
-    # Statistics computed fields
+    # Statistics computed fields (prefetch=False: reading one customer's
+    # aggregates must not load or recompute them for prefetched siblings)
     admissibility_count = fields.Integer(string='Admissibility Count', 
-                                        compute='_compute_request_counts', store=True)
+                                        compute='_compute_request_counts', store=True, prefetch=False)
     association_count = fields.Integer(string='Association Count', 
-                                      compute='_compute_request_counts', store=True)
+                                      compute='_compute_request_counts', store=True, prefetch=False)
     disassociation_count = fields.Integer(string='Disassociation Count', 
-                                         compute='_compute_request_counts', store=True)
+                                         compute='_compute_request_counts', store=True, prefetch=False)
     device_count = fields.Integer(string='Device Count', 
-                                 compute='_compute_device_count', store=True)
+                                 compute='_compute_device_count', store=True, prefetch=False)
     
     # Status fields
     has_active_associations = fields.Boolean(string='Has Active Associations', 
-                                            compute='_compute_status_fields', store=True)
+                                            compute='_compute_status_fields', store=True, prefetch=False)
     latest_request_date = fields.Datetime(string='Latest Request Date', 
-                                         compute='_compute_status_fields', store=True)
+                                         compute='_compute_status_fields', store=True, prefetch=False)
     
     # Constraints
     _sql_constraints = [
@@ -91,36 +99,98 @@ class TadaCustomer(models.Model):
     def _compute_display_name(self):
         """Compute display name for better UX."""
         for record in self:
-            name_parts = []
-            if record.first_name:
-                name_parts.append(record.first_name)
-            if record.last_name:
-                name_parts.append(record.last_name)
-            
-            if name_parts:
-                record.display_name = f"{' '.join(name_parts)} ({record.fiscal_code})"
+            full_name = f"{record.first_name or ''} {record.last_name or ''}".strip()
+            if full_name:
+                record.display_name = f"{full_name} ({record.fiscal_code})"
             else:
                 record.display_name = record.fiscal_code or 'Customer'
     
     @api.depends('admissibility_request_ids', 'association_request_ids', 'disassociation_request_ids')
     def _compute_request_counts(self):
         """Compute request counts."""
+        # Count per customer in SQL instead of loading every request;
+        # unsaved records fall back to the in-memory relations
+        customer_ids = [record_id for record_id in self.ids if isinstance(record_id, int)]
+        counts = {}
+        if customer_ids:
+            for model_name in ('tada.admissibility.request', 'tada.association.request',
+                               'tada.disassociation.request'):
+                counts[model_name] = {
+                    customer.id: count
+                    for customer, count in self.env[model_name]._read_group(
+                        [('customer_id', 'in', customer_ids)], groupby=['customer_id'], aggregates=['__count']
+                    )
+                }
+        
         for record in self:
-            record.admissibility_count = len(record.admissibility_request_ids)
-            record.association_count = len(record.association_request_ids)
-            record.disassociation_count = len(record.disassociation_request_ids)
+            if not isinstance(record.id, int):
+                record.admissibility_count = len(record.admissibility_request_ids)
+                record.association_count = len(record.association_request_ids)
+                record.disassociation_count = len(record.disassociation_request_ids)
+                continue
+            record.admissibility_count = counts['tada.admissibility.request'].get(record.id, 0)
+            record.association_count = counts['tada.association.request'].get(record.id, 0)
+            record.disassociation_count = counts['tada.disassociation.request'].get(record.id, 0)
     
     @api.depends('device_ids')
     def _compute_device_count(self):
         """Compute device count."""
+        customer_ids = tuple(record_id for record_id in self.ids if isinstance(record_id, int))
+        device_counts = {}
+        if customer_ids:
+            # tada.device has no inverse field to group on; count the relation table
+            self.flush_recordset(['device_ids'])
+            relation = self._fields['device_ids'].relation
+            self.env.cr.execute(
+                f'SELECT customer_id, COUNT(*) FROM "{relation}" WHERE customer_id IN %s GROUP BY customer_id',
+                (customer_ids,)
+            )
+            device_counts = dict(self.env.cr.fetchall())
+        
         for record in self:
-            record.device_count = len(record.device_ids)
+            if not isinstance(record.id, int):
+                record.device_count = len(record.device_ids)
+                continue
+            record.device_count = device_counts.get(record.id, 0)
     
     @api.depends('association_request_ids.status', 'disassociation_request_ids.status',
                  'admissibility_request_ids.created_at', 'association_request_ids.created_at',
                  'disassociation_request_ids.created_at')
     def _compute_status_fields(self):
         """Compute status fields."""
+        # Aggregate per customer in SQL; unsaved records fall back to Python
+        customer_ids = [record_id for record_id in self.ids if isinstance(record_id, int)]
+        active_counts = {}
+        disassociated_counts = {}
+        latest_dates = {}
+        if customer_ids:
+            domain = [('customer_id', 'in', customer_ids)]
+            for model_name, count_statuses, counts in (
+                ('tada.association.request', ('ASSOCIATED', 'TAKEN_IN_CHARGE'), active_counts),
+                ('tada.disassociation.request', ('DISASSOCIATED',), disassociated_counts),
+                ('tada.admissibility.request', (), None),
+            ):
+                for customer, status, count, max_created_at in self.env[model_name]._read_group(
+                    domain, groupby=['customer_id', 'status'], aggregates=['__count', 'created_at:max']
+                ):
+                    if status in count_statuses:
+                        counts[customer.id] = counts.get(customer.id, 0) + count
+                    if max_created_at and (
+                        customer.id not in latest_dates or max_created_at > latest_dates[customer.id]
+                    ):
+                        latest_dates[customer.id] = max_created_at
+        
+        for record in self:
+            if not isinstance(record.id, int):
+                record._compute_status_fields_python()
+                continue
+            record.has_active_associations = (
+                active_counts.get(record.id, 0) > disassociated_counts.get(record.id, 0)
+            )
+            record.latest_request_date = latest_dates.get(record.id)
+    
+    def _compute_status_fields_python(self):
+        """Compute status fields from the in-memory relations (unsaved records)."""
         for record in self:
             # Check for active associations
             active_associations = record.association_request_ids.filtered(
@@ -132,17 +202,13 @@ class TadaCustomer(models.Model):
             record.has_active_associations = len(active_associations) > len(active_disassociations)
             
             # Find latest request date
-            all_dates = []
-            for req in record.admissibility_request_ids:
-                if req.created_at:
-                    all_dates.append(req.created_at)
-            for req in record.association_request_ids:
-                if req.created_at:
-                    all_dates.append(req.created_at)
-            for req in record.disassociation_request_ids:
-                if req.created_at:
-                    all_dates.append(req.created_at)
-            
+            all_dates = [
+                req.created_at
+                for requests in (record.admissibility_request_ids, record.association_request_ids,
+                                 record.disassociation_request_ids)
+                for req in requests
+                if req.created_at
+            ]
             record.latest_request_date = max(all_dates) if all_dates else None
     
     @api.constrains('fiscal_code', 'company_id')
@@ -157,7 +223,7 @@ class TadaCustomer(models.Model):
             
             # Validate format and normalize
             try:
-                normalized_fiscal_code = validate_fiscal_code(
+                normalized_fiscal_code = validate_fiscal_code_cached(
                     record.fiscal_code, 
                     raise_on_error=not is_api_sync
                 )
@@ -232,32 +298,30 @@ class TadaCustomer(models.Model):
         )
         
         sdk = self.get_sdk_instance()
-        
-        # Collect all unique fiscal codes from API requests
-        fiscal_codes = set()
-        
-        # Get fiscal codes from admissibility requests
-        admissibility_requests = sdk.get_admissibility_requests()
-        if not (isinstance(admissibility_requests, dict) and admissibility_requests.get('error')):
-            for req in admissibility_requests:
-                if req.fiscal_code:
-                    fiscal_codes.add(req.fiscal_code)
-        
-        # Get fiscal codes from association requests
-        association_requests = sdk.get_association_requests()
-        if not (isinstance(association_requests, dict) and association_requests.get('error')):
-            for req in association_requests:
-                if req.fiscal_code:
-                    fiscal_codes.add(req.fiscal_code)
-        
-        # Get fiscal codes from disassociation requests
-        disassociation_requests = sdk.get_disassociation_requests()
-        if not (isinstance(disassociation_requests, dict) and disassociation_requests.get('error')):
-            for req in disassociation_requests:
-                if req.fiscal_code:
-                    fiscal_codes.add(req.fiscal_code)
-        
-        if not fiscal_codes:
+        company_id = company_id or self.env.company.id
+        
+        # Download each request list once and group it by fiscal code
+        customers = {}
+        for list_name, fetch in (
+            ('admissibility_requests', sdk.get_admissibility_requests),
+            ('association_requests', sdk.get_association_requests),
+            ('disassociation_requests', sdk.get_disassociation_requests),
+        ):
+            requests = fetch()
+            if isinstance(requests, dict) and requests.get('error'):
+                _logger.warning(f"Could not fetch {list_name}: {requests.get('message', 'Unknown error')}")
+                continue
+            requests_by_fiscal_code = defaultdict(list)
+            for request in requests:
+                if request.fiscal_code:
+                    requests_by_fiscal_code[request.fiscal_code].append(request)
+            for fiscal_code, customer_requests in requests_by_fiscal_code.items():
+                customer = customers.get(fiscal_code)
+                if customer is None:
+                    customer = customers[fiscal_code] = Customer(fiscal_code=fiscal_code)
+                setattr(customer, list_name, customer_requests)
+        
+        if not customers:
             return {
                 'type': 'ir.actions.client',
                 'tag': 'display_notification',
@@ -267,22 +331,32 @@ class TadaCustomer(models.Model):
                 }
             }
         
-        # Sync each customer from API
-        synced_count = 0
+        # Build each customer locally like sdk.get_customer_info does, without
+        # downloading the lists again, then write them all in bulk
         failed_count = 0
+        vals_list = []
         
-        for fiscal_code in fiscal_codes:
+        for fiscal_code, customer in customers.items():
             try:
-                result = self._sync_single_customer(fiscal_code, company_id)
-                if result.get('type') == 'ir.actions.client' and 'success' in result.get('params', {}).get('message', ''):
-                    synced_count += 1
-                else:
-                    failed_count += 1
+                # Personal details come from the first request carrying them
+                for request in customer.association_requests + customer.disassociation_requests:
+                    if request.first_name:
+                        customer.first_name = request.first_name
+                        customer.last_name = request.last_name
+                        customer.email = request.email
+                        customer.user_type = request.user_type
+                        customer.group = request.group
+                        break
+                vals_list.append(self._prepare_customer_data_from_dataclass(customer, company_id))
                     
             except Exception as e:
                 _logger.error(f"Failed to sync customer {fiscal_code}: {e}")
                 failed_count += 1
         
+        created_count, updated_count, skipped_count = self._bulk_create_or_update(vals_list)
+        synced_count = created_count + updated_count
+        failed_count += skipped_count
+        
         message = f'Synced {synced_count} customers successfully from API'
         if failed_count > 0:
             message += f', {failed_count} failed'
@@ -333,32 +407,24 @@ class TadaCustomer(models.Model):
             if not company_id:
                 company_id = self.env.company.id
             
-            # Collect all unique fiscal codes from local request records
-            fiscal_codes = set()
-            
-            # Get fiscal codes from local admissibility requests
-            admissibility_requests = self.env['tada.admissibility.request'].search([
-                ('company_id', '=', company_id)
-            ])
-            for req in admissibility_requests:
-                if req.fiscal_code:
-                    fiscal_codes.add(req.fiscal_code)
-            
-            # Get fiscal codes from local association requests
-            association_requests = self.env['tada.association.request'].search([
-                ('company_id', '=', company_id)
-            ])
-            for req in association_requests:
-                if req.fiscal_code:
-                    fiscal_codes.add(req.fiscal_code)
-            
-            # Get fiscal codes from local disassociation requests
-            disassociation_requests = self.env['tada.disassociation.request'].search([
-                ('company_id', '=', company_id)
-            ])
-            for req in disassociation_requests:
-                if req.fiscal_code:
-                    fiscal_codes.add(req.fiscal_code)
+            # Collect all unique fiscal codes from local request records in one
+            # query; UNION deduplicates across the three tables server-side
+            request_models = [
+                self.env[model_name]
+                for model_name in ('tada.admissibility.request', 'tada.association.request',
+                                   'tada.disassociation.request')
+            ]
+            for model in request_models:
+                model.flush_model(['fiscal_code', 'company_id'])
+            self.env.cr.execute(
+                " UNION ".join(
+                    f'SELECT fiscal_code FROM "{model._table}" '
+                    f"WHERE company_id = %s AND fiscal_code IS NOT NULL AND fiscal_code != ''"
+                    for model in request_models
+                ),
+                (company_id,) * len(request_models)
+            )
+            fiscal_codes = {row[0] for row in self.env.cr.fetchall()}
             
             if not fiscal_codes:
                 return {
@@ -370,31 +436,43 @@ class TadaCustomer(models.Model):
                     }
                 }
             
-            # Create customers from local data
+            # Build and write customers in chunks, so the record cache holds at
+            # most one chunk of customers and their linked requests at a time
             synced_count = 0
             failed_count = 0
+            fiscal_codes = sorted(fiscal_codes)
+            size = self._local_sync_chunk_size
             
-            for fiscal_code in fiscal_codes:
-                try:
-                    # Build customer info from local requests
-                    customer_info = self._build_customer_from_local_requests(fiscal_code, company_id)
-                    
-                    if not customer_info:
-                        _logger.warning(f"No customer info found for fiscal code: {fiscal_code}")
+            for start in range(0, len(fiscal_codes), size):
+                chunk = fiscal_codes[start:start + size]
+                personal_info = self._get_local_personal_info(chunk, company_id)
+                vals_list = []
+                
+                for fiscal_code in chunk:
+                    try:
+                        # Build customer info from local requests
+                        customer_info = self._build_customer_from_local_requests(
+                            fiscal_code, company_id, personal_info=personal_info
+                        )
+                        
+                        if not customer_info:
+                            _logger.warning(f"No customer info found for fiscal code: {fiscal_code}")
+                            failed_count += 1
+                            continue
+                        
+                        vals_list.append(self._prepare_customer_data_from_dataclass(customer_info, company_id))
+                        
+                    except Exception as e:
+                        _logger.error(f"Failed to sync customer {fiscal_code}: {e}")
                         failed_count += 1
-                        continue
-                    
-                    # Find or create customer record
-                    customer_data = self._prepare_customer_data_from_dataclass(customer_info, company_id)
-                    customer_record = self.create_or_update(customer_data)
-                    
-                    # Link related requests and devices
-                    customer_record._link_related_records()
-                    synced_count += 1
-                    
-                except Exception as e:
-                    _logger.error(f"Failed to sync customer {fiscal_code}: {e}")
-                    failed_count += 1
+                
+                # Find or create this chunk's customer records in bulk
+                created_count, updated_count, skipped_count = self._bulk_create_or_update(vals_list)
+                synced_count += created_count + updated_count
+                failed_count += skipped_count
+                
+                # Flush the chunk and drop it from the cache
+                self.env.invalidate_all()
             
             message = f'Synced {synced_count} customers successfully from local data'
             if failed_count > 0:
@@ -414,62 +492,58 @@ class TadaCustomer(models.Model):
             raise UserError(f"Sync all customers failed: {str(e)}")
     
     @api.model
-    def _build_customer_from_local_requests(self, fiscal_code, company_id):
-        """Build a Customer dataclass instance from local request records."""
-        from ..sdk.chain2gate_sdk import Customer, UserType
+    def _get_local_personal_info(self, fiscal_codes, company_id):
+        """
+        Load customer personal info from local requests for many fiscal codes.
         
-        # Get all requests for this fiscal code
-        admissibility_requests = self.env['tada.admissibility.request'].search([
-            ('fiscal_code', '=', fiscal_code),
-            ('company_id', '=', company_id)
-        ])
+        Association requests take precedence over disassociation requests, and
+        within a model the first request (in model order) with a first name wins.
         
-        association_requests = self.env['tada.association.request'].search([
-            ('fiscal_code', '=', fiscal_code),
-            ('company_id', '=', company_id)
-        ])
+        Args:
+            fiscal_codes (iterable): Fiscal codes to look up
+            company_id (int): Company of the requests
+            
+        Returns:
+            dict: Row with first_name, last_name, email, user_type and group per fiscal code
+        """
+        personal_info = {}
+        remaining = set(fiscal_codes)
+        fields_to_read = ['fiscal_code', 'first_name', 'last_name', 'email', 'user_type', 'group']
+        for model_name in ('tada.association.request', 'tada.disassociation.request'):
+            # Stop as soon as every fiscal code has personal info, and only ask
+            # the next model for the codes still missing
+            if not remaining:
+                break
+            domain = [
+                ('fiscal_code', 'in', list(remaining)),
+                ('company_id', '=', company_id),
+                ('first_name', '!=', False),
+            ]
+            limit = 1 if len(remaining) == 1 else None
+            for row in self.env[model_name].search_read(domain, fields_to_read, limit=limit):
+                personal_info.setdefault(row['fiscal_code'], row)
+            remaining.difference_update(personal_info)
+        return personal_info
+    
+    @api.model
+    def _build_customer_from_local_requests(self, fiscal_code, company_id, personal_info=None):
+        """Build a Customer dataclass instance from local request records."""
+        from ..sdk.chain2gate_sdk import Customer, UserType
         
-        disassociation_requests = self.env['tada.disassociation.request'].search([
-            ('fiscal_code', '=', fiscal_code),
-            ('company_id', '=', company_id)
-        ])
+        if personal_info is None:
+            personal_info = self._get_local_personal_info([fiscal_code], company_id)
         
         # Extract customer details from the first available request with personal info
-        first_name = None
-        last_name = None
-        email = None
-        user_type = None
-        group = None
-        
-        # Try to get personal info from association requests first (most complete)
-        for req in association_requests:
-            if req.first_name:
-                first_name = req.first_name
-                last_name = req.last_name
-                email = req.email
-                user_type = UserType(req.user_type) if req.user_type else None
-                group = req.group
-                break
-        
-        # If not found, try disassociation requests
-        if not first_name:
-            for req in disassociation_requests:
-                if req.first_name:
-                    first_name = req.first_name
-                    last_name = req.last_name
-                    email = req.email
-                    user_type = UserType(req.user_type) if req.user_type else None
-                    group = req.group
-                    break
+        info = personal_info.get(fiscal_code) or {}
         
         # Create Customer dataclass instance
         customer = Customer(
             fiscal_code=fiscal_code,
-            first_name=first_name,
-            last_name=last_name,
-            email=email,
-            user_type=user_type,
-            group=group
+            first_name=info.get('first_name') or None,
+            last_name=info.get('last_name') or None,
+            email=info.get('email') or None,
+            user_type=UserType(info['user_type']) if info.get('user_type') else None,
+            group=info.get('group') or None
         )
         
         # For now, we don't need to populate the request lists in the customer object
@@ -483,28 +557,28 @@ class TadaCustomer(models.Model):
     
     def _prepare_customer_data_from_dataclass(self, dataclass_instance, company_id=None):
         """Prepare customer data from dataclass for create_or_update."""
-        from dataclasses import asdict
+        from dataclasses import fields as dc_fields
         from enum import Enum
         
-        data = asdict(dataclass_instance)
         odoo_data = {}
         
         # Validate that we have a fiscal code
-        if not data.get('fiscal_code'):
-            raise UserError(f"Cannot create customer without fiscal code. Data: {data}")
-        
-        # List of relationship fields that should be skipped during data preparation
-        relationship_fields = ['admissibility_requests', 'association_requests', 'disassociation_requests', 'devices']
-        
-        for dc_field_name, value in data.items():
-            # Skip relationship fields - they will be handled separately
-            if dc_field_name in relationship_fields:
-                continue
-                
+        if not dataclass_instance.fiscal_code:
+            raise UserError(f"Cannot create customer without fiscal code. Data: {dataclass_instance}")
+        
+        # Direct attribute access: asdict() would deep-copy the relationship lists
+        data_items = [
+            (dc_field.name, getattr(dataclass_instance, dc_field.name))
+            for dc_field in dc_fields(dataclass_instance)
+            if dc_field.name not in _RELATIONSHIP_FIELDS
+        ]
+        
+        datetime_fields = self._get_datetime_field_set()
+        for dc_field_name, value in data_items:
             # Store all data in plain text
             if isinstance(value, Enum):
                 odoo_data[dc_field_name] = value.value
-            elif dc_field_name.endswith('_at') or 'date' in dc_field_name.lower():
+            elif dc_field_name in datetime_fields:
                 parsed_dt = self._parse_datetime(value)
                 if parsed_dt:
                     odoo_data[dc_field_name] = parsed_dt
@@ -520,82 +594,95 @@ class TadaCustomer(models.Model):
         
         # Ensure fiscal_code is set
         if not odoo_data.get('fiscal_code'):
-            raise UserError(f"Fiscal code missing for customer {data.get('fiscal_code')}")
+            raise UserError(f"Fiscal code missing for customer {dataclass_instance.fiscal_code}")
         
         return odoo_data
     
     def _link_related_records(self):
-        """Link related requests and devices to this customer."""
-        self.ensure_one()
+        """
+        Link related requests and devices to these customers.
+        
+        Works on the whole recordset: each related model is searched once
+        for all fiscal codes, and requests are linked with one write per
+        customer instead of one per request.
+        """
+        if not self:
+            return
         
         # Validate company access
         self._validate_company_access("link related records")
         
-        # Use plain text fiscal code for searching
-        fiscal_code = self.fiscal_code
-        
-        # Link admissibility requests (only from same company)
-        admissibility_requests = self.env['tada.admissibility.request'].search([
-            ('fiscal_code', '=', fiscal_code),
-            ('company_id', '=', self.company_id.id)
-        ])
-        for req in admissibility_requests:
-            # Validate company consistency before linking
-            if req.company_id != self.company_id:
-                _logger.warning(
-                    f"Skipping admissibility request {req.id} - company mismatch: "
-                    f"customer company {self.company_id.name}, request company {req.company_id.name}"
-                )
-                continue
-            req.customer_id = self.id
-        
-        # Link association requests (only from same company)
-        association_requests = self.env['tada.association.request'].search([
-            ('fiscal_code', '=', fiscal_code),
-            ('company_id', '=', self.company_id.id)
-        ])
-        for req in association_requests:
-            # Validate company consistency before linking
-            if req.company_id != self.company_id:
-                _logger.warning(
-                    f"Skipping association request {req.id} - company mismatch: "
-                    f"customer company {self.company_id.name}, request company {req.company_id.name}"
-                )
-                continue
-            req.customer_id = self.id
-        
-        # Link disassociation requests (only from same company)
-        disassociation_requests = self.env['tada.disassociation.request'].search([
-            ('fiscal_code', '=', fiscal_code),
-            ('company_id', '=', self.company_id.id)
-        ])
-        for req in disassociation_requests:
-            # Validate company consistency before linking
-            if req.company_id != self.company_id:
-                _logger.warning(
-                    f"Skipping disassociation request {req.id} - company mismatch: "
-                    f"customer company {self.company_id.name}, request company {req.company_id.name}"
-                )
-                continue
-            req.customer_id = self.id
+        # Customers by (fiscal code, company); requests only link within their company
+        customers_by_key = {(record.fiscal_code, record.company_id.id): record for record in self}
+        domain = [
+            ('fiscal_code', 'in', list({record.fiscal_code for record in self})),
+            ('company_id', 'in', self.company_id.ids)
+        ]
+        
+        association_requests = self.env['tada.association.request']
+        for model_name in ('tada.admissibility.request', 'tada.association.request',
+                           'tada.disassociation.request'):
+            requests = self.env[model_name].search(domain)
+            if model_name == 'tada.association.request':
+                association_requests = requests
+            
+            to_link = {}
+            for req in requests:
+                customer = customers_by_key.get((req.fiscal_code, req.company_id.id))
+                if customer and req.customer_id != customer:
+                    to_link[customer] = to_link.get(customer, req.browse()) | req
+            for customer, customer_requests in to_link.items():
+                customer_requests.write({'customer_id': customer.id})
         
         # Link devices based on association requests (only from same company)
-        device_serials = set()
+        serials_by_customer = {}
         for req in association_requests:
             if req.serial and req.status in ['ASSOCIATED', 'TAKEN_IN_CHARGE']:
-                device_serials.add(req.serial)
-        
-        if device_serials:
-            devices = self.env['tada.device'].search([
-                ('device_id', 'in', list(device_serials)),
-                ('company_id', '=', self.company_id.id)
-            ])
-            # Validate that all devices belong to the same company
-            if devices:
-                MultiCompanyValidator.validate_related_records_company(
-                    self, devices, "devices"
+                customer = customers_by_key.get((req.fiscal_code, req.company_id.id))
+                if customer:
+                    serials_by_customer.setdefault(customer, set()).add(req.serial)
+        
+        if serials_by_customer:
+            all_serials = set().union(*serials_by_customer.values())
+            devices_by_key = {
+                (device.device_id, device.company_id.id): device
+                for device in self.env['tada.device'].search([
+                    ('device_id', 'in', list(all_serials)),
+                    ('company_id', 'in', self.company_id.ids)
+                ])
+            }
+            rows = []
+            for customer, serials in serials_by_customer.items():
+                devices = self.env['tada.device'].browse([
+                    devices_by_key[key].id
+                    for key in ((serial, customer.company_id.id) for serial in serials)
+                    if key in devices_by_key
+                ])
+                # Validate that all devices belong to the same company
+                if devices:
+                    MultiCompanyValidator.validate_related_records_company(
+                        customer, devices, "devices"
+                    )
+                rows.extend((customer.id, device_id) for device_id in devices.ids)
+            
+            # Replace the device links of these customers directly in the
+            # relation table (one DELETE, one INSERT) instead of per-customer
+            # (6, 0, ids) commands, which diff the current rows first
+            linked = self.browse([customer.id for customer in serials_by_customer])
+            linked.flush_recordset(['device_ids'])
+            relation = self._fields['device_ids'].relation
+            self.env.cr.execute(
+                f'DELETE FROM "{relation}" WHERE customer_id IN %s', (tuple(linked.ids),)
+            )
+            if rows:
+                self.env.cr.execute(
+                    f'INSERT INTO "{relation}" (customer_id, device_id) VALUES '
+                    + ', '.join(['(%s, %s)'] * len(rows))
+                    + ' ON CONFLICT DO NOTHING',
+                    [value for row in rows for value in row]
                 )
-            self.device_ids = [(6, 0, devices.ids)]
+            linked.invalidate_recordset(['device_ids'])
+            linked.modified(['device_ids'])
     
     def action_view_admissibility_requests(self):
         """View admissibility requests for this customer."""
@@ -684,6 +771,49 @@ class TadaCustomer(models.Model):
             record._link_related_records()
             return record
     
+    @api.model
+    def _bulk_create_or_update(self, vals_list):
+        """
+        Batch variant of ``create_or_update``.
+        
+        Existing customers are matched by fiscal code and company with one
+        search; new ones are created together and existing ones written in
+        grouped writes, then linked to their requests and devices.
+        
+        Args:
+            vals_list (list): Customer values, each with fiscal_code
+            
+        Returns:
+            tuple: (created_count, updated_count, skipped_count)
+        """
+        for vals in vals_list:
+            vals.setdefault('company_id', self.env.company.id)
+        if not vals_list:
+            return 0, 0, 0
+        
+        existing = self.search([
+            ('fiscal_code', 'in', list({vals['fiscal_code'] for vals in vals_list})),
+            ('company_id', 'in', list({vals['company_id'] for vals in vals_list}))
+        ])
+        existing_by_key = {(record.fiscal_code, record.company_id.id): record for record in existing}
+        
+        to_create = []
+        updates = {}
+        for vals in vals_list:
+            record = existing_by_key.get((vals['fiscal_code'], vals['company_id']))
+            if record:
+                # Repeated entries for one customer are merged, last one wins
+                updates.setdefault(record.id, (record, {}))[1].update(vals)
+            else:
+                to_create.append(vals)
+        
+        created_count, updated_count, skipped_count = self._sync_apply_batch(to_create, list(updates.values()))
+        
+        # New customers are linked by create(); link the updated ones too
+        self.browse(list(updates))._link_related_records()
+        
+        return created_count, updated_count, skipped_count
+    
     @api.model_create_multi
     def create(self, vals_list):
         """Override create to set created_at if not provided."""
@@ -691,17 +821,20 @@ class TadaCustomer(models.Model):
             if 'created_at' not in vals:
                 vals['created_at'] = fields.Datetime.now()
         records = super().create(vals_list)
-        # Link related records after creation
-        for record in records:
-            record._link_related_records()
+        # Link related records after creation, in one pass for all customers
+        records._link_related_records()
         return records
     
     def write(self, vals):
-        """Override write to set updated_at."""
-        vals['updated_at'] = fields.Datetime.now()
-        result = super().write(vals)
-        # Re-link related records if fiscal code changed
+        """Override write to re-link related records when the fiscal code changes.
+
+        The updated_at stamp is handled by the mixin's write().
+        """
+        # Only records whose fiscal code actually changes need re-linking
+        relink = self.browse()
         if 'fiscal_code' in vals:
-            for record in self:
-                record._link_related_records()
+            relink = self.filtered(lambda r: r.fiscal_code != vals['fiscal_code'])
+        result = super().write(vals)
+        if relink:
+            relink._link_related_records()
         return result
\ No newline at end of file
@@ -84,6 +84,11 @@ class TadaDevice(models.Model):
     @api.depends('m1', 'm2', 'm2_2', 'm2_3', 'm2_4')
     def _compute_meter_types(self):
         """Compute meter type capabilities."""
+        # Load just the POD columns in one narrow query instead of letting
+        # the first access prefetch every column of the device table
+        self.browse(
+            [record_id for record_id in self.ids if isinstance(record_id, int)]
+        ).fetch(['m1', 'm2', 'm2_2', 'm2_3', 'm2_4'])
         for record in self:
             record.has_consumption = bool(record.m1)
             record.has_production = bool(record.m2 or record.m2_2 or record.m2_3 or record.m2_4)
@@ -102,46 +107,119 @@ class TadaDevice(models.Model):
             if isinstance(devices, dict) and devices.get('error'):
                 raise UserError(f"API Error: {devices.get('message', 'Unknown error')}")
             
-            synced_count = 0
-            updated_count = 0
             current_company_id = company_id or self.env.company.id
             
+            # Prefetch existing devices for the whole batch in one query
+            # instead of searching by device_id and MAC for every device
+            device_ids = [device.id for device in devices]
+            macs = [device.mac for device in devices if device.mac]
+            rows = self.search_read([
+                ('company_id', '=', current_company_id),
+                '|', ('device_id', 'in', device_ids), ('mac', 'in', macs)
+            ], ['device_id', 'mac'])
+            existing_by_device_id = {row['device_id']: row['id'] for row in rows}
+            existing_by_mac = {row['mac']: row['id'] for row in rows if row['mac']}
+            
+            # Split the payload into creates and updates without touching the DB
+            now = fields.Datetime.now()
+            to_create = []
+            updates = {}
+            pending_by_device_id = {}
+            pending_by_mac = {}
+            duplicate_count = 0
             for device in devices:
-                # First try to find by device_id within company
-                existing = self.search([
-                    ('device_id', '=', device.id),
-                    ('company_id', '=', current_company_id)
-                ], limit=1)
+                vals = self._dataclass_to_vals(device)
+                vals['last_sync'] = now
+                
+                # First try to match by device_id, then by MAC within company
+                existing_id = existing_by_device_id.get(device.id) or (
+                    device.mac and existing_by_mac.get(device.mac)
+                )
+                if existing_id:
+                    vals['updated_at'] = now
+                    # Repeated entries for one record are merged, last one wins
+                    updates.setdefault(existing_id, (self.browse(existing_id), {}))[1].update(vals)
+                    continue
                 
-                # If not found by device_id and device has MAC, try to find by MAC within company
-                if not existing and hasattr(device, 'mac') and device.mac:
-                    existing = self.search([
-                        ('mac', '=', device.mac),
-                        ('company_id', '=', current_company_id)
-                    ], limit=1)
+                pending = pending_by_device_id.get(device.id) or (
+                    device.mac and pending_by_mac.get(device.mac)
+                )
+                if pending:
+                    pending.update(vals)
+                    duplicate_count += 1
+                    continue
                 
-                if existing:
-                    existing.update_from_dataclass(device)
-                    existing.last_sync = fields.Datetime.now()
-                    updated_count += 1
-                else:
-                    new_device = self.from_dataclass(device, current_company_id)
-                    new_device.last_sync = fields.Datetime.now()
-                    synced_count += 1
+                vals.update(company_id=current_company_id, created_at=now, updated_at=now)
+                to_create.append(vals)
+                pending_by_device_id[device.id] = vals
+                if device.mac:
+                    pending_by_mac[device.mac] = vals
+            
+            synced_count, updated_count, skipped_count = self._sync_apply_batch(
+                to_create, list(updates.values())
+            )
+            updated_count += duplicate_count
             
             message = f'Synced {synced_count} new and updated {updated_count} devices'
+            if skipped_count > 0:
+                message += f' (skipped {skipped_count} due to errors)'
             return {
                 'type': 'ir.actions.client',
                 'tag': 'display_notification',
                 'params': {
                     'message': message,
-                    'type': 'success',
+                    'type': 'success' if skipped_count == 0 else 'warning',
                 }
             }
         except Exception as e:
             _logger.error(f"Failed to sync devices: {e}")
             raise UserError(f"Sync failed: {str(e)}")
     
+    @api.model
+    def action_sync_from_api_background(self):
+        """Schedule a device sync of the current company on a cron worker."""
+        self.check_access_rights('write')
+        company = self.env.company
+        # Only the flagged companies are synced by the triggered job
+        company.sudo().tada_device_sync_requested = True
+        self.env.ref('tada_admin.ir_cron_sync_requested_devices')._trigger()
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'message': f'Device sync scheduled for {company.name}, devices will update in the background',
+                'type': 'info',
+            }
+        }
+    
+    @api.model
+    def _cron_sync_from_api(self):
+        """Sync devices for every company with an active TADA integration."""
+        self._sync_companies_from_api(self.env['res.company'].search([
+            ('tada_active', '=', True),
+            ('tada_api_key', '!=', False)
+        ]))
+    
+    @api.model
+    def _cron_sync_requested_from_api(self):
+        """Sync devices for the companies that requested it from the device list."""
+        requested = self.env['res.company'].search([('tada_device_sync_requested', '=', True)])
+        requested.tada_device_sync_requested = False
+        self._sync_companies_from_api(requested.filtered(
+            lambda company: company.tada_active and company.tada_api_key
+        ))
+    
+    @api.model
+    def _sync_companies_from_api(self, companies):
+        """Sync devices for each company in its own company context."""
+        for company in companies:
+            try:
+                # One company's failure must not roll back the others
+                with self.env.cr.savepoint():
+                    self.with_company(company).sync_from_api(company_id=company.id)
+            except Exception as e:
+                _logger.error("Scheduled device sync failed for company %s: %s", company.name, e)
+    
     def action_refresh_from_api(self):
         """Refresh this specific device from API."""
         self.ensure_one()
@@ -152,25 +230,23 @@ class TadaDevice(models.Model):
         sdk = self.get_sdk_instance()
         
         try:
-            # Get all devices and find this one
-            devices = sdk.get_devices()
+            # Only query the device's own type when the stored type name is a known one
+            try:
+                device_type = DeviceType(self.type_name)
+            except ValueError:
+                device_type = None
+            device_data = sdk.get_device(self.device_id, device_type)
             
-            if isinstance(devices, dict) and devices.get('error'):
-                raise UserError(f"API Error: {devices.get('message', 'Unknown error')}")
-            
-            # Find the specific device
-            device_data = None
-            for device in devices:
-                if device.id == self.device_id:
-                    device_data = device
-                    break
+            if isinstance(device_data, dict) and device_data.get('error'):
+                raise UserError(f"API Error: {device_data.get('message', 'Unknown error')}")
             
             if not device_data:
                 raise UserError(f"Device {self.device_id} not found in API response.")
             
-            # Update record with API response
-            self.update_from_dataclass(device_data)
-            self.last_sync = fields.Datetime.now()
+            # Update record with API response and sync time in a single write
+            vals = self._dataclass_to_vals(device_data)
+            vals['last_sync'] = fields.Datetime.now()
+            self.write(vals)
             
             return {
                 'type': 'ir.actions.client',
@@ -188,18 +264,14 @@ class TadaDevice(models.Model):
         """View association requests for this device."""
         self.ensure_one()
         
-        # Find association requests that use this device's serial
-        association_requests = self.env['tada.association.request'].search([
-            ('serial', '=', self.device_id),
-            ('company_id', '=', self.company_id.id)
-        ])
-        
+        # Let the list view query association requests using this device's
+        # serial itself, paginated, instead of materializing every id here
         return {
             'type': 'ir.actions.act_window',
             'name': f'Association Requests for {self.du_name}',
             'res_model': 'tada.association.request',
             'view_mode': 'list,form',
-            'domain': [('id', 'in', association_requests.ids)],
+            'domain': [('serial', '=', self.device_id), ('company_id', '=', self.company_id.id)],
             'context': {'default_serial': self.device_id},
         }
 
@@ -241,8 +313,9 @@ class TadaDevice(models.Model):
         return super().create(vals_list)
     
     def write(self, vals):
-        """Override write to set updated_at."""
-        vals['updated_at'] = fields.Datetime.now()
+        """Override write to skip re-saves of identical data (e.g. sync retries)."""
+        if len(self) == 1 and self._is_noop_write(vals):
+            return True
         return super().write(vals)
     
     @api.model
@@ -3,12 +3,12 @@
 Odoo model for TADA Disassociation Requests with plain text storage.
 """
 
-from odoo import models, fields, api
+from odoo import models, fields, api, tools
 from odoo.exceptions import UserError, ValidationError
 import logging
 
 from ..sdk.chain2gate_sdk import DisassociationRequest, Status, PodMType, UserType
-from ...utils.fiscal_code_validator import validate_fiscal_code
+from ...utils.fiscal_code_validator import FiscalCodeValidator, validate_fiscal_code_cached
 
 _logger = logging.getLogger(__name__)
 
@@ -18,7 +18,7 @@ class TadaDisassociationRequest(models.Model):
     
     _name = 'tada.disassociation.request'
     _description = 'TADA Disassociation Request'
-    _inherit = ['tada.dataclass.mixin']
+    _inherit = ['tada.pod.request.mixin']
     _rec_name = 'pod'
     _order = 'created_at desc'
     
@@ -86,27 +86,26 @@ class TadaDisassociationRequest(models.Model):
          'POD and Serial combination must be unique per company!'),
     ]
     
+    def init(self):
+        """Create the composite index behind per-customer lookups."""
+        super().init()
+        tools.create_index(
+            self.env.cr, 'tada_disassoc_req_fc_company_idx', self._table,
+            ['fiscal_code', 'company_id']
+        )
+    
     @api.constrains('fiscal_code')
     def _check_fiscal_code(self):
-        """Validate fiscal code format."""
+        """Validate fiscal code format (create and write already normalized it)."""
+        if self.env.context.get('skip_fiscal_code_validation'):
+            return
+        
         for record in self:
             if record.fiscal_code:
-                # Check if we're in an API sync context (non-blocking mode)
-                is_api_sync = self.env.context.get('skip_fiscal_code_validation', False)
-                
                 try:
-                    normalized_fiscal_code = validate_fiscal_code(
-                        record.fiscal_code, 
-                        raise_on_error=not is_api_sync
-                    )
-                    # Update the field with normalized value if different
-                    if normalized_fiscal_code != record.fiscal_code:
-                        record.fiscal_code = normalized_fiscal_code
+                    validate_fiscal_code_cached(record.fiscal_code)
                 except ValidationError as e:
-                    if not is_api_sync:
-                        raise ValidationError(f"Invalid fiscal code '{record.fiscal_code}': {str(e)}")
-                    # In API sync mode, just log the error and continue
-                    _logger.warning(f"Skipping validation for invalid fiscal code '{record.fiscal_code}': {str(e)}")
+                    raise ValidationError(f"Invalid fiscal code '{record.fiscal_code}': {str(e)}")
     
     @api.depends('first_name', 'last_name', 'pod')
     def _compute_display_name(self):
@@ -133,46 +132,11 @@ class TadaDisassociationRequest(models.Model):
             if isinstance(requests, dict) and requests.get('error'):
                 raise UserError(f"API Error: {requests.get('message', 'Unknown error')}")
             
-            synced_count = 0
-            updated_count = 0
-            skipped_count = 0
             current_company_id = company_id or self.env.company.id
             
-            # Use context to skip fiscal code validation during sync
-            sync_context = self.env.context.copy()
-            sync_context['skip_fiscal_code_validation'] = True
-            
-            for request in requests:
-                # Use a savepoint for each record to handle individual failures
-                try:
-                    with self.env.cr.savepoint():
-                        # First try to find by request_id within company
-                        existing = self.with_context(sync_context).search([
-                            ('request_id', '=', request.id),
-                            ('company_id', '=', current_company_id)
-                        ], limit=1)
-                        
-                        # If not found by request_id, try to find by POD, serial and company
-                        if not existing and hasattr(request, 'pod') and hasattr(request, 'serial'):
-                            existing = self.with_context(sync_context).search([
-                                ('pod', '=', request.pod),
-                                ('serial', '=', request.serial),
-                                ('company_id', '=', current_company_id)
-                            ], limit=1)
-                        
-                        if existing:
-                            existing.with_context(sync_context).update_from_dataclass(request)
-                            updated_count += 1
-                        else:
-                            self.with_context(sync_context).from_dataclass(request, current_company_id)
-                            synced_count += 1
-                            
-                except Exception as e:
-                    # Log the error but continue with other records
-                    # The savepoint automatically rolls back this individual record's changes
-                    _logger.warning(f"Failed to sync disassociation request {getattr(request, 'id', 'unknown')}: {str(e)}")
-                    skipped_count += 1
-                    continue
+            synced_count, updated_count, skipped_count = self._sync_pod_requests(
+                requests, (('request_id',), ('pod', 'serial')), current_company_id
+            )
             
             message = f'Synced {synced_count} new and updated {updated_count} disassociation requests'
             if skipped_count > 0:
@@ -262,26 +226,54 @@ class TadaDisassociationRequest(models.Model):
             _logger.error(f"Failed to refresh disassociation request: {e}")
             raise UserError(f"Refresh failed: {str(e)}")
     
+    def _find_original_associations(self):
+        """
+        Find the original association request of each disassociation request.
+        
+        One query covers the whole recordset; an association matches on POD,
+        serial, fiscal code and company, and the first one in model order wins.
+        
+        Returns:
+            dict: Association request id per disassociation request id
+        """
+        if not self:
+            return {}
+        rows = self.env['tada.association.request'].search_read([
+            ('pod', 'in', list(set(self.mapped('pod')))),
+            ('serial', 'in', list(set(self.mapped('serial')))),
+            ('fiscal_code', 'in', list(set(self.mapped('fiscal_code')))),
+            ('company_id', 'in', self.company_id.ids)
+        ], ['pod', 'serial', 'fiscal_code', 'company_id'])
+        
+        association_by_key = {}
+        for row in rows:
+            key = (row['pod'], row['serial'], row['fiscal_code'], row['company_id'][0])
+            association_by_key.setdefault(key, row['id'])
+        
+        originals = {}
+        for record in self:
+            association_id = association_by_key.get(
+                (record.pod, record.serial, record.fiscal_code, record.company_id.id)
+            )
+            if association_id:
+                originals[record.id] = association_id
+        return originals
+    
     def action_view_original_association(self):
         """View the original association request for this disassociation."""
         self.ensure_one()
         
-        # Find association request with same POD and serial within company
-        association = self.env['tada.association.request'].search([
-            ('pod', '=', self.pod),
-            ('serial', '=', self.serial),
-            ('fiscal_code', '=', self.fiscal_code),
-            ('company_id', '=', self.company_id.id)
-        ], limit=1)
+        # Find association request with same POD, serial and fiscal code within company
+        association_id = self._find_original_associations().get(self.id)
         
-        if not association:
+        if not association_id:
             raise UserError("No matching association request found.")
         
         return {
             'type': 'ir.actions.act_window',
             'name': 'Original Association Request',
             'res_model': 'tada.association.request',
-            'res_id': association.id,
+            'res_id': association_id,
             'view_mode': 'form',
             'target': 'current',
         }
@@ -312,45 +304,47 @@ class TadaDisassociationRequest(models.Model):
         for vals in vals_list:
             if 'created_at' not in vals:
                 vals['created_at'] = fields.Datetime.now()
+            if vals.get('fiscal_code'):
+                vals['fiscal_code'] = FiscalCodeValidator.normalize(vals['fiscal_code'])
         
         records = super().create(vals_list)
         
-        # Trigger POD summary recomputation for new records
-        for record in records:
-            if record.pod and record.fiscal_code:
-                self.env['tada_admin.pod.summary']._recompute_pod_summaries_for_request(
-                    record.pod, record.fiscal_code, record.company_id.id
-                )
+        # Trigger POD summary recomputation once for all new records
+        self.env['tada_admin.pod.summary']._recompute_pod_summaries_for_requests(
+            records._get_pod_summary_keys()
+        )
         
         return records
     
     def unlink(self):
         """Override unlink to trigger POD summary recomputation."""
         # Store info before deletion
-        pod_info = [(r.pod, r.fiscal_code, r.company_id.id) for r in self if r.pod and r.fiscal_code]
+        pod_keys = self._get_pod_summary_keys()
         
         result = super().unlink()
         
         # Trigger recomputation after deletion
-        for pod, fiscal_code, company_id in pod_info:
-            self.env['tada_admin.pod.summary']._recompute_pod_summaries_for_request(
-                pod, fiscal_code, company_id
-            )
+        self.env['tada_admin.pod.summary']._recompute_pod_summaries_for_requests(pod_keys)
         
         return result
     
     def write(self, vals):
-        """Override write to set updated_at and trigger POD summary recomputation."""
-        vals['updated_at'] = fields.Datetime.now()
+        """Override write to trigger POD summary recomputation (the mixin sets updated_at)."""
+        if vals.get('fiscal_code'):
+            vals = dict(vals, fiscal_code=FiscalCodeValidator.normalize(vals['fiscal_code']))
+        # Re-saves of identical data (e.g. sync retries) are skipped entirely
+        if len(self) == 1 and self._is_noop_write(vals):
+            return True
+        if not any(field in vals for field in ['pod', 'fiscal_code', 'status', 'company_id']):
+            return super().write(vals)
+        
+        # Summaries keyed by the old values need a refresh too when a key field moves
+        pod_keys = self._get_pod_summary_keys()
         result = super().write(vals)
+        if any(field in vals for field in ['pod', 'fiscal_code', 'company_id']):
+            pod_keys |= self._get_pod_summary_keys()
         
-        # Trigger POD summary recomputation if relevant fields changed
-        if any(field in vals for field in ['pod', 'fiscal_code', 'status', 'company_id']):
-            for record in self:
-                if record.pod and record.fiscal_code:
-                    self.env['tada_admin.pod.summary']._recompute_pod_summaries_for_request(
-                        record.pod, record.fiscal_code, record.company_id.id
-                    )
+        self.env['tada_admin.pod.summary']._recompute_pod_summaries_for_requests(pod_keys)
         
         return result
     
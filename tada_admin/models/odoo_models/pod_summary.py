@@ -306,18 +306,43 @@ class TadaPodSummary(models.Model):
     @api.model
     def _recompute_pod_summaries_for_request(self, pod_code, fiscal_code, company_id):
         """Helper method to trigger recomputation when request records change."""
-        if pod_code and fiscal_code and company_id:
-            pod_summaries = self.search([
-                ('pod_code', '=', pod_code),
-                ('customer_fiscal_code', '=', fiscal_code),
-                ('company_id', '=', company_id)
-            ])
-            if pod_summaries:
-                # Update status from requests and trigger recomputation
-                for pod_summary in pod_summaries:
-                    pod_summary.update_status_from_requests()
-                # Also update the timestamp to trigger other computed fields
-                pod_summaries.write({'updated_at': fields.Datetime.now()})
+        self._recompute_pod_summaries_for_requests([(pod_code, fiscal_code, company_id)])
+    
+    @api.model
+    def _recompute_pod_summaries_for_requests(self, pod_keys):
+        """
+        Batch variant of ``_recompute_pod_summaries_for_request``.
+        
+        Does nothing when the context sets ``defer_pod_summary`` (bulk sync):
+        the caller collects the touched keys itself and recomputes them all
+        at once after the batch.
+        
+        Args:
+            pod_keys (iterable): ``(pod_code, fiscal_code, company_id)`` tuples;
+                duplicates and incomplete keys are ignored
+        """
+        if self.env.context.get('defer_pod_summary'):
+            return
+        
+        pod_keys = {key for key in pod_keys if all(key)}
+        if not pod_keys:
+            return
+        
+        # One search for all keys, then keep only the exact combinations
+        candidates = self.search([
+            ('pod_code', 'in', list({key[0] for key in pod_keys})),
+            ('customer_fiscal_code', 'in', list({key[1] for key in pod_keys})),
+            ('company_id', 'in', list({key[2] for key in pod_keys}))
+        ])
+        pod_summaries = candidates.filtered(
+            lambda summary: (summary.pod_code, summary.customer_fiscal_code, summary.company_id.id) in pod_keys
+        )
+        if pod_summaries:
+            # Update status from requests and trigger recomputation
+            for pod_summary in pod_summaries:
+                pod_summary.update_status_from_requests()
+            # Also update the timestamp to trigger other computed fields
+            pod_summaries.write({'updated_at': fields.Datetime.now()})
     
     # Permission methods based on status progression
     @api.depends('pod_status')
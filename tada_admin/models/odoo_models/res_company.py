@@ -8,6 +8,8 @@ from odoo.exceptions import ValidationError
 import requests
 import logging
 
+from ..mixins.dataclass_mixin import clear_sdk_cache
+
 _logger = logging.getLogger(__name__)
 
 
@@ -32,6 +34,12 @@ class ResCompany(models.Model):
         help='Enable/disable TADA Admin integration for this company'
     )
     
+    tada_device_sync_requested = fields.Boolean(
+        string='Device Sync Requested',
+        copy=False,
+        help='Set from the device list, cleared once the background device sync ran'
+    )
+    
     tada_last_sync = fields.Datetime(
         string='Last Sync',
         help='Last successful synchronization with TADA API'
@@ -49,6 +57,13 @@ class ResCompany(models.Model):
         compute='_compute_tada_connection_status'
     )
 
+    def write(self, vals):
+        """Override write to drop cached SDK clients when API settings change."""
+        result = super().write(vals)
+        if 'tada_api_key' in vals or 'tada_base_url' in vals:
+            clear_sdk_cache(self.env.cr.dbname, self.ids)
+        return result
+
     @api.depends('tada_api_key', 'tada_base_url', 'tada_active')
     def _compute_tada_connection_status(self):
         """Compute TADA connection status and message"""
@@ -435,6 +435,20 @@ class Chain2GateSDK:
         """Get devices by specific type (more reliable than getting all devices)"""
         return self.get_devices(device_type, limit)
 
+    def get_device(self, device_id: str, device_type: DeviceType = None) -> Union[Chain2GateDevice, Dict, None]:
+        """Get a single device by id, querying only its type when known and
+        stopping at the first type that contains it"""
+        error = None
+        for dtype in ([device_type] if device_type else DeviceType):
+            devices = self.get_devices(dtype)
+            if isinstance(devices, dict) and devices.get("error"):
+                error = devices
+                continue
+            for device in devices:
+                if device.id == device_id:
+                    return device
+        return error
+
     # === HELPER METHODS ===
     def get_customer_info(self, fiscal_code: str, skip_devices: bool = False) -> Union[Customer, Dict]:
         """Get complete customer information including all requests and devices"""
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
+from . import test_api_sync
 from . import test_authorization_service
 
 from . import test_company_permissions
-from . import test_pod_authorization
\ No newline at end of file
+from . import test_pod_authorization
+from . import test_sync_helpers
\ No newline at end of file
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+from odoo import Command
+from odoo.exceptions import AccessError
+
+from odoo.tests.common import TransactionCase
+
+from ..models.sdk.chain2gate_sdk import (
+    AdmissibilityRequest, AssociationRequest, PodMType, Status, UserType
+)
+
+
+class TestApiSync(TransactionCase):
+    """Test cases for syncing SDK payloads into TADA models"""
+
+    def setUp(self):
+        super(TestApiSync, self).setUp()
+        self.Admissibility = self.env['tada.admissibility.request']
+        self.Association = self.env['tada.association.request']
+        self.Customer = self.env['tada.customer']
+
+    def _admissibility_request(self, **overrides):
+        """Build an SDK admissibility request with API-style ISO timestamps"""
+        values = {
+            'id': 'ADM-001',
+            'pod': 'IT001E00000001',
+            'status': Status.PENDING,
+            'message': '',
+            'fiscal_code': 'RSSMRA80A01H501U',
+            'closed_at': None,
+            'created_at': '2024-01-01T10:00:00.000Z',
+            'updated_at': '2024-01-01T10:00:00.000Z',
+            'group': '',
+        }
+        values.update(overrides)
+        return AdmissibilityRequest(**values)
+
+    def _association_request(self, **overrides):
+        """Build an SDK association request with API-style ISO timestamps"""
+        values = {
+            'id': 'ASC-001',
+            'pod': 'IT001E00000002',
+            'serial': 'SER-001',
+            'request_type': '',
+            'pod_m_type': PodMType.M1,
+            'user_type': UserType.CONSUMER,
+            'first_name': 'Mario',
+            'last_name': 'Rossi',
+            'email': '',
+            'contract_signed': True,
+            'product': '',
+            'status': Status.PENDING,
+            'message': '',
+            'fiscal_code': 'RSSMRA80A01H501U',
+            'closed_at': None,
+            'created_at': '2024-01-01T10:00:00.000Z',
+            'updated_at': '2024-01-01T10:00:00.000Z',
+            'group': '',
+        }
+        values.update(overrides)
+        return AssociationRequest(**values)
+
+    def _sync_admissibility(self, requests):
+        """Run sync_from_api against a fake SDK returning the given requests"""
+        sdk = Mock()
+        sdk.get_admissibility_requests.return_value = requests
+        with patch.object(type(self.Admissibility), 'get_sdk_instance', return_value=sdk):
+            return self.Admissibility.sync_from_api()
+
+    def test_sync_creates_with_iso_timestamps(self):
+        """Test that ISO timestamps from the API are parsed on create"""
+        result = self._sync_admissibility([self._admissibility_request()])
+
+        self.assertEqual(result['params']['type'], 'success')
+        record = self.Admissibility.search([('request_id', '=', 'ADM-001')])
+        self.assertEqual(len(record), 1)
+        self.assertEqual(record.created_at, datetime(2024, 1, 1, 10, 0))
+
+    def test_sync_updates_with_iso_timestamps(self):
+        """Test that a resync updates existing records with ISO timestamps"""
+        self._sync_admissibility([self._admissibility_request()])
+
+        result = self._sync_admissibility([self._admissibility_request(
+            status=Status.ADMISSIBLE,
+            closed_at='2024-01-02T09:30:00Z',
+            updated_at='2024-01-02T09:30:00.000Z',
+        )])
+
+        self.assertEqual(result['params']['type'], 'success')
+        record = self.Admissibility.search([('request_id', '=', 'ADM-001')])
+        self.assertEqual(len(record), 1)
+        self.assertEqual(record.status, 'ADMISSIBLE')
+        self.assertEqual(record.closed_at, datetime(2024, 1, 2, 9, 30))
+
+    def test_sync_merges_repeated_entries(self):
+        """Test that repeated payload entries for one request create a single record"""
+        result = self._sync_admissibility([
+            self._admissibility_request(),
+            self._admissibility_request(status=Status.ADMISSIBLE),
+        ])
+
+        self.assertIn('Synced 1 new and updated 1', result['params']['message'])
+        record = self.Admissibility.search([('request_id', '=', 'ADM-001')])
+        self.assertEqual(len(record), 1)
+        self.assertEqual(record.status, 'ADMISSIBLE')
+
+    def test_bulk_upsert_recomputes_linked_customer(self):
+        """Test that an upserted status change reaches the linked customer"""
+        company_id = self.env.company.id
+        self.Association._bulk_upsert_from_sdk([self._association_request()], company_id)
+        customer = self.Customer.create({
+            'fiscal_code': 'RSSMRA80A01H501U',
+            'company_id': company_id,
+        })
+        self.assertEqual(customer.association_count, 1)
+        self.assertFalse(customer.has_active_associations)
+
+        created, updated, skipped, records = self.Association._bulk_upsert_from_sdk(
+            [self._association_request(status=Status.ASSOCIATED)], company_id
+        )
+
+        self.assertEqual((created, updated, skipped), (0, 1, 0))
+        self.assertEqual(records.status, 'ASSOCIATED')
+        self.assertTrue(customer.has_active_associations)
+
+    def test_bulk_upsert_skips_invalid_fiscal_codes(self):
+        """Test that the upsert does not store requests with an invalid fiscal code"""
+        created, updated, skipped, records = self.Association._bulk_upsert_from_sdk([
+            self._association_request(),
+            self._association_request(id='ASC-002', pod='IT001E00000003', fiscal_code='INVALID'),
+        ], self.env.company.id)
+
+        self.assertEqual((created, updated, skipped), (1, 0, 1))
+        self.assertEqual(records.request_id, 'ASC-001')
+        self.assertFalse(self.Association.search([('request_id', '=', 'ASC-002')]))
+
+    def test_bulk_upsert_rejects_foreign_company(self):
+        """Test that the upsert refuses a company the user does not belong to"""
+        other_company = self.env['res.company'].create({'name': 'Other Company'})
+        # Creating a company grants it to the creator, take it away again
+        self.env.user.write({'company_ids': [Command.unlink(other_company.id)]})
+
+        with self.assertRaises(AccessError):
+            self.Association._bulk_upsert_from_sdk([self._association_request()], other_company.id)
+
+    def test_user_type_default_keeps_explicit_value(self):
+        """Test that the POD M type only fills a missing user type"""
+        values = {
+            'request_id': 'ASC-010',
+            'pod': 'IT001E00000010',
+            'serial': 'SER-010',
+            'pod_m_type': 'M1',
+            'fiscal_code': 'RSSMRA80A01H501U',
+        }
+        suggested = self.Association.create(values)
+        self.assertEqual(suggested.user_type, 'CONSUMER')
+
+        explicit = self.Association.create(dict(
+            values, request_id='ASC-011', serial='SER-011', user_type='PROSUMER'
+        ))
+        explicit.write({'pod_m_type': 'M2'})
+        explicit.write({'pod_m_type': 'M1'})
+        self.assertEqual(explicit.user_type, 'PROSUMER')
@@ -110,6 +110,20 @@ class TestCompanyPermissions(TransactionCase):
         self.assertFalse(self.CompanyPermissions.check_permission(self.company_a.id, 'MAGAZZINO'))
         self.assertTrue(self.CompanyPermissions.check_permission(self.company_a.id, 'MONITORAGGIO'))  # Default
 
+    def test_check_permission_after_write(self):
+        """Test that cached permissions are refreshed after a write"""
+        permissions = self.CompanyPermissions.create({
+            'company_id': self.company_a.id,
+            'is_partner_energia': False,
+        })
+        self.assertFalse(self.CompanyPermissions.check_permission(self.company_a.id, 'PARTNER_ENERGIA'))
+        
+        permissions.write({'is_partner_energia': True})
+        self.assertTrue(self.CompanyPermissions.check_permission(self.company_a.id, 'PARTNER_ENERGIA'))
+        
+        permissions.unlink()
+        self.assertFalse(self.CompanyPermissions.check_permission(self.company_a.id, 'PARTNER_ENERGIA'))
+
     def test_check_permission_invalid_type(self):
         """Test checking invalid permission type raises error"""
         with self.assertRaises(ValidationError):
@@ -157,6 +171,25 @@ class TestCompanyPermissions(TransactionCase):
         with self.assertRaises(ValidationError):
             self.CompanyPermissions.set_company_permissions(self.company_a.id, permissions_dict)
 
+    def test_set_many(self):
+        """Test setting permissions for several companies at once"""
+        existing = self.CompanyPermissions.create({
+            'company_id': self.company_a.id,
+        })
+        
+        records = self.CompanyPermissions.set_many({
+            self.company_a.id: {'is_partner_energia': True},
+            self.company_b.id: {'has_magazzino': True},
+        })
+        
+        self.assertEqual(len(records), 2)
+        self.assertIn(existing, records)
+        self.assertTrue(existing.is_partner_energia)
+        self.assertTrue(self.CompanyPermissions.check_permission(self.company_b.id, 'MAGAZZINO'))
+        
+        with self.assertRaises(ValidationError):
+            self.CompanyPermissions.set_many({self.company_a.id: {'invalid_key': True}})
+
     def test_get_companies_with_permission(self):
         """Test getting companies with specific permission"""
         # Create permissions for multiple companies
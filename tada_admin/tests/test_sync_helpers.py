@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+from datetime import datetime
+
+from odoo.exceptions import ValidationError
+from odoo.tests.common import TransactionCase
+
+from ..models.mixins.dataclass_mixin import _parse_dt_cached
+from ..utils.fiscal_code_validator import validate_fiscal_code_cached
+
+
+class TestSyncHelpers(TransactionCase):
+    """Test cases for the memoized helpers used by API sync"""
+
+    def test_parse_dt_iso_formats(self):
+        """Test that the API's ISO layouts parse to naive datetimes"""
+        expected = datetime(2024, 1, 1, 10, 0)
+        for value in ('2024-01-01T10:00:00.000Z', '2024-01-01T10:00:00Z',
+                      '2024-01-01T10:00:00', '2024-01-01 10:00:00'):
+            self.assertEqual(_parse_dt_cached(value), expected, value)
+        self.assertEqual(_parse_dt_cached('2024-01-01'), datetime(2024, 1, 1))
+
+    def test_parse_dt_fraction(self):
+        """Test that fractional seconds are padded to microseconds"""
+        self.assertEqual(
+            _parse_dt_cached('2024-01-01T10:00:00.5Z'),
+            datetime(2024, 1, 1, 10, 0, 0, 500000)
+        )
+
+    def test_parse_dt_invalid(self):
+        """Test that unparseable or out-of-range values return None"""
+        self.assertIsNone(_parse_dt_cached('not a date'))
+        self.assertIsNone(_parse_dt_cached('2024-13-01T10:00:00Z'))
+
+    def test_parse_dt_is_memoized(self):
+        """Test that repeated values are served from the cache"""
+        value = '2024-02-03T04:05:06.000Z'
+        _parse_dt_cached(value)
+        hits = _parse_dt_cached.cache_info().hits
+        self.assertEqual(_parse_dt_cached(value), datetime(2024, 2, 3, 4, 5, 6))
+        self.assertEqual(_parse_dt_cached.cache_info().hits, hits + 1)
+
+    def test_validate_fiscal_code_normalizes(self):
+        """Test that a valid fiscal code is returned normalized"""
+        self.assertEqual(validate_fiscal_code_cached(' rssmra80a01h501u '), 'RSSMRA80A01H501U')
+        self.assertEqual(validate_fiscal_code_cached('RSSMRA80A01H501U'), 'RSSMRA80A01H501U')
+
+    def test_validate_fiscal_code_invalid(self):
+        """Test that invalid codes raise on every call, or pass through unchanged"""
+        for _attempt in range(2):
+            with self.assertRaises(ValidationError):
+                validate_fiscal_code_cached('RSSMRA80A01H501X')
+        self.assertEqual(
+            validate_fiscal_code_cached('RSSMRA80A01H501X', raise_on_error=False),
+            'RSSMRA80A01H501X'
+        )
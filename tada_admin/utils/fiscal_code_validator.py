@@ -4,6 +4,8 @@ Italian Fiscal Code validation utilities for TADA ERP.
 """
 
 import re
+from functools import lru_cache
+
 from odoo.exceptions import ValidationError
 
 
@@ -102,13 +104,13 @@ class FiscalCodeValidator:
         if len(fiscal_code) != 16:
             return False
         
-        # Calculate check digit
-        total = 0
-        for i, char in enumerate(fiscal_code[:15]):
-            if i % 2 == 0:  # Odd position (1-based)
-                total += cls.ODD_CHARS.get(char, 0)
-            else:  # Even position (1-based)
-                total += cls.EVEN_CHARS.get(char, 0)
+        # Calculate check digit: odd positions (1-based) are the even slice indexes
+        odd_chars = cls.ODD_CHARS
+        even_chars = cls.EVEN_CHARS
+        total = (
+            sum(odd_chars.get(char, 0) for char in fiscal_code[0:15:2])
+            + sum(even_chars.get(char, 0) for char in fiscal_code[1:15:2])
+        )
         
         expected_check_digit = cls.CHECK_DIGITS[total % 26]
         return fiscal_code[15] == expected_check_digit
@@ -204,6 +206,17 @@ def validate_fiscal_code(fiscal_code, raise_on_error=True):
     return FiscalCodeValidator.normalize(fiscal_code)
 
 
+@lru_cache(maxsize=4096)
+def validate_fiscal_code_cached(fiscal_code, raise_on_error=True):
+    """
+    Memoized ``validate_fiscal_code`` for paths that see the same codes repeatedly.
+    
+    Exceptions are not cached, so invalid codes are re-validated (and raise)
+    on every call. The cache is bounded, so long-running workers stay small.
+    """
+    return validate_fiscal_code(fiscal_code, raise_on_error=raise_on_error)
+
+
 def check_fiscal_code_uniqueness(model, fiscal_code, company_id, record_id=None):
     """
     Check if fiscal code is unique within company boundaries.